@@ -2,13 +2,53 @@
 
 __version__ = "1.1.1"
 
-from .bot import Bot, BotError
-from .client import BalatroClient, BalatroError
-from .collector import Collector, Stats
-from .config import Config, Task, get_model_config
-from .executor import Executor
-from .llm import LLMClient, LLMClientError, LLMRetryExhaustedError, LLMTimeoutError
-from .strategy import StrategyManager, StrategyManifest
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .bot import Bot, BotError
+    from .client import BalatroClient, BalatroError
+    from .collector import Collector, Stats
+    from .config import Config, Task, get_model_config
+    from .executor import Executor
+    from .llm import (
+        LLMClient,
+        LLMClientError,
+        LLMRetryExhaustedError,
+        LLMTimeoutError,
+    )
+    from .strategy import StrategyManager, StrategyManifest
+
+# Public names are imported on first access so the CLI (and `--help`) does not
+# pay for openai/httpx/jinja2 until a run actually needs them
+_EXPORTS = {
+    "Bot": ".bot",
+    "BotError": ".bot",
+    "BalatroClient": ".client",
+    "BalatroError": ".client",
+    "Collector": ".collector",
+    "Stats": ".collector",
+    "Config": ".config",
+    "Task": ".config",
+    "get_model_config": ".config",
+    "Executor": ".executor",
+    "LLMClient": ".llm",
+    "LLMClientError": ".llm",
+    "LLMRetryExhaustedError": ".llm",
+    "LLMTimeoutError": ".llm",
+    "StrategyManager": ".strategy",
+    "StrategyManifest": ".strategy",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily (PEP 562)."""
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Client
@@ -1,13 +1,17 @@
 """Core LLM-powered Balatro bot implementation."""
 
 import asyncio
-import json
 import logging
+import queue
 import time
+from collections.abc import Awaitable, Callable
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
 import httpx
+import openai
+import orjson
 from openai.types.chat import ChatCompletion
 
 from .client import BalatroClient, BalatroError
@@ -19,11 +23,14 @@ from .collector import (
     Stats,
 )
 from .config import Config, Task, get_model_config
-from .llm import LLMClient, LLMClientError, LLMTimeoutError
+from .llm import SDK_MAX_RETRY_DELAY, LLMClient, LLMClientError, LLMTimeoutError
 from .strategy import StrategyManager
 
 logger = logging.getLogger(__name__)
 
+# Takes the current gamestate, performs one step, returns the next gamestate
+StateHandler = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
 
 class BotError(Exception):
     """Base exception for bot errors."""
@@ -32,12 +39,28 @@ class BotError(Exception):
 
 
 class Bot:
-    """One-shot LLM-powered Balatro bot. Creates clients, plays a single game, returns stats."""
-
-    def __init__(self, task: Task, config: Config, port: int | None = None) -> None:
+    """LLM-powered Balatro bot. Creates clients, plays games, returns stats.
+
+    A bot plays one game per `play()` call. To play another task on the same
+    instance, call `reset(task)` first: clients and compiled strategy templates
+    are kept, per-run state is cleared.
+    """
+
+    def __init__(
+        self,
+        task: Task,
+        config: Config,
+        port: int | None = None,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+        openai_client: openai.AsyncOpenAI | None = None,
+    ) -> None:
         self.task = task
         self.config = config
         self.port = port if port is not None else config.port
+        # Shared clients are owned (and closed) by the caller
+        self._http_client = http_client
+        self._openai_client = openai_client
         self.model_config = get_model_config(config.model_config)
         self.strategy = StrategyManager(task.strategy)
 
@@ -45,6 +68,10 @@ class Bot:
         self._llm: LLMClient | None = None
         self._collector: Collector | None = None
 
+        # Run log: records are queued on the event loop and written by a thread
+        self._log_handler: QueueHandler | None = None
+        self._log_listener: QueueListener | None = None
+
         self._last_error_msg: str | None = None
         self._last_failed_msg: str | None = None
         self._history: list[dict[str, Any]] = []
@@ -55,17 +82,45 @@ class Bot:
         self._consecutive_errors: int = 0
         self._consecutive_faileds: int = 0
 
+        # Game state dispatch (None marks a terminal state)
+        self._state_handlers: dict[str, StateHandler | None] = {
+            "SELECTING_HAND": self._handle_llm_turn,
+            "SHOP": self._handle_llm_turn,
+            "SMODS_BOOSTER_OPENED": self._handle_llm_turn,
+            "ROUND_EVAL": self._handle_cash_out,
+            "BLIND_SELECT": self._handle_select,
+            "GAME_OVER": None,
+        }
+
+    def reset(self, task: Task) -> None:
+        """Prepare the bot for a new run of `task`, keeping clients and templates."""
+        if task.strategy != self.task.strategy:
+            self.strategy = StrategyManager(task.strategy)
+        self.task = task
+
+        self._collector = None
+        self._last_error_msg = None
+        self._last_failed_msg = None
+        self._history = []
+        self._finish_reason = None
+        self._consecutive_errors = 0
+        self._consecutive_faileds = 0
+        if self._llm is not None:
+            self._llm.reset_timeout_counter()
+
     async def __aenter__(self) -> "Bot":
         """Initialize all clients."""
         self._balatro = BalatroClient(
             host=self.config.host,
             port=self.port,
+            http_client=self._http_client,
         )
         await self._balatro.__aenter__()
 
         self._llm = LLMClient(
             base_url=self.config.base_url,
             api_key=self.config.api_key or "",
+            openai_client=self._openai_client,
         )
         await self._llm.__aenter__()
 
@@ -73,6 +128,7 @@ class Bot:
 
     async def __aexit__(self, *_: Any) -> None:
         """Clean up all clients."""
+        self._teardown_file_logging()
         if self._llm is not None:
             await self._llm.__aexit__(None, None, None)
             self._llm = None
@@ -85,6 +141,7 @@ class Bot:
         if self._collector is None:
             return
 
+        self._teardown_file_logging()
         root_logger = logging.getLogger()
         root_logger.setLevel(logging.INFO)
         for handler in root_logger.handlers[:]:
@@ -99,7 +156,27 @@ class Bot:
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
         )
-        root_logger.addHandler(file_handler)
+
+        # Keep disk writes off the event loop: the root logger only enqueues
+        # records, a background listener thread owns the FileHandler.
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+        self._log_handler = QueueHandler(log_queue)
+        self._log_listener = QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        root_logger.addHandler(self._log_handler)
+
+    def _teardown_file_logging(self) -> None:
+        """Flush pending log records and close the run log file."""
+        if self._log_handler is not None:
+            logging.getLogger().removeHandler(self._log_handler)
+            self._log_handler = None
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            for handler in self._log_listener.handlers:
+                handler.close()
+            self._log_listener = None
 
     async def _wait_for_menu(self, timeout: float = 10.0) -> None:
         """Wait for game to be in MENU state."""
@@ -174,6 +251,8 @@ class Bot:
                     logger.debug(
                         f"Could not write stats (normal if run failed early): {e}"
                     )
+                finally:
+                    self._collector.close()
 
         return self._collector._calculate_stats(
             self._finish_reason or "unexpected_error"
@@ -197,22 +276,62 @@ class Bot:
             await asyncio.sleep(0.5)
             await self._balatro.call("gamestate")
 
-            match current_state:
-                case "SELECTING_HAND" | "SHOP" | "SMODS_BOOSTER_OPENED":
-                    response = await self._get_llm_response(gamestate)
-                    gamestate = await self._execute_tool_call(response)
-                case "ROUND_EVAL":
-                    gamestate = await self._balatro.call("cash_out")
-                case "BLIND_SELECT":
-                    # NOTE: This bot always selects and never skips blinds
-                    gamestate = await self._balatro.call("select")
-                case "GAME_OVER":
-                    self._finish_reason = "lost"
-                    logger.info("Game over!")
-                    break
-                case _:
-                    await asyncio.sleep(1)
-                    gamestate = await self._balatro.call("gamestate")
+            handler = self._state_handlers.get(current_state, self._handle_default)
+            if handler is None:
+                self._finish_reason = "lost"
+                logger.info("Game over!")
+                break
+            gamestate = await handler(gamestate)
+
+    async def _handle_llm_turn(self, gamestate: dict[str, Any]) -> dict[str, Any]:
+        """Ask the LLM for an action and execute it."""
+        response = await self._get_llm_response(gamestate)
+        return await self._execute_tool_call(response)
+
+    async def _handle_cash_out(self, _: dict[str, Any]) -> dict[str, Any]:
+        """Collect the round rewards."""
+        assert self._balatro is not None
+        return await self._balatro.call("cash_out")
+
+    async def _handle_select(self, _: dict[str, Any]) -> dict[str, Any]:
+        """Select the upcoming blind."""
+        assert self._balatro is not None
+        # NOTE: This bot always selects and never skips blinds
+        return await self._balatro.call("select")
+
+    async def _handle_default(self, _: dict[str, Any]) -> dict[str, Any]:
+        """Wait for a transient state to settle."""
+        assert self._balatro is not None
+        await asyncio.sleep(1)
+        return await self._balatro.call("gamestate")
+
+    def _build_messages(
+        self, strategy_content: str, gamestate_content: str, memory_content: str
+    ) -> list[dict[str, Any]]:
+        """Build the user message in the configured message format.
+
+        The strategy always comes first: it is byte-identical across turns, so it
+        forms a stable prompt prefix that providers can serve from their KV cache.
+        Anthropic models only cache with an explicit `cache_control` hint, so
+        "auto" sends them chunks.
+        """
+        message_format = self.config.message_format
+        if message_format == "auto":
+            anthropic = self.task.model.startswith("anthropic/")
+            message_format = "chunks" if anthropic else "text"
+        if message_format == "chunks":
+            content: str | list[dict[str, Any]] = [
+                {
+                    "type": "text",
+                    "text": strategy_content,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": gamestate_content},
+                {"type": "text", "text": memory_content},
+            ]
+        else:
+            content = "\n\n".join([strategy_content, gamestate_content, memory_content])
+        return [{"role": "user", "content": content}]
 
     async def _get_llm_response(self, gamestate: dict[str, Any]) -> ChatCompletion:
         """Get LLM response for current game state."""
@@ -228,20 +347,9 @@ class Bot:
             last_failure=self._last_failed_msg,
         )
 
-        messages = [
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": strategy_content,
-                        "cache_control": {"type": "ephemeral"},
-                    },
-                    {"type": "text", "text": gamestate_content},
-                    {"type": "text", "text": memory_content},
-                ],
-            }
-        ]
+        messages = self._build_messages(
+            strategy_content, gamestate_content, memory_content
+        )
 
         tools = self.strategy.get_tools(gamestate["state"])
 
@@ -255,24 +363,18 @@ class Bot:
         custom_id = self._collector.write_request(request_data)
         request_id = str(time.time_ns() // 1_000_000)
 
+        # The game is idle while the LLM generates, so take the screenshot
+        # concurrently instead of after the response arrives.
+        screenshot = asyncio.create_task(self._take_screenshot(custom_id))
+
         try:
-            response = await self._llm.call(
-                model=self.task.model,
-                messages=messages,
-                tools=tools,
-                model_config=self.model_config,
-            )
+            response = await self._call_llm(messages, tools)
+            response_id = str(time.time_ns() // 1_000_000)
 
-            try:
-                await self._balatro.call(
-                    "screenshot",
-                    {"path": str(self._collector.screenshot_dir / f"{custom_id}.png")},
-                )
-            except BalatroError as e:
-                logger.warning(f"Screenshot failed: {e}")
+            await screenshot
 
             self._collector.write_response(
-                id=str(time.time_ns() // 1_000_000),
+                id=response_id,
                 custom_id=custom_id,
                 response=ChatCompletionResponse(
                     request_id=request_id,
@@ -290,7 +392,7 @@ class Bot:
                 error=ChatCompletionError(code="timeout", message=str(e)),
             )
             self._finish_reason = "llm_abort"
-            raise BotError("3 consecutive LLM timeouts") from e
+            raise BotError(f"LLM timeout: {e}") from e
 
         except LLMClientError as e:
             self._collector.write_response(
@@ -301,6 +403,62 @@ class Bot:
             self._finish_reason = "llm_abort"
             raise BotError(f"LLM error: {e}") from e
 
+        except asyncio.CancelledError:
+            screenshot.cancel()
+            raise
+
+        finally:
+            # Never leave the screenshot request dangling on the Balatro client
+            await asyncio.gather(screenshot, return_exceptions=True)
+
+    async def _call_llm(
+        self, messages: list[dict[str, Any]], tools: list[dict[str, Any]]
+    ) -> ChatCompletion:
+        """Call the LLM, cancelling the request once the turn deadline is exceeded.
+
+        httpx timeouts apply per network operation, so a slowly trickling
+        response can outlive LLMClient.timeout. The deadline bounds the whole
+        call: every LLMClient attempt, the openai SDK's own retries within each
+        attempt, and the backoff sleeps of both.
+        """
+        assert self._llm is not None
+
+        timeout = self.model_config.get("timeout", self._llm.timeout)
+        if not isinstance(timeout, (int, float)):
+            timeout = self._llm.timeout
+        retries = self._llm.max_retries
+        sdk_retries = self._llm.sdk_max_retries
+        attempt = timeout * (sdk_retries + 1) + sdk_retries * SDK_MAX_RETRY_DELAY
+        deadline = attempt * retries + (2 ** (retries - 1) - 1)
+
+        try:
+            return await asyncio.wait_for(
+                self._llm.call(
+                    model=self.task.model,
+                    messages=messages,
+                    tools=tools,
+                    model_config=self.model_config,
+                ),
+                timeout=deadline,
+            )
+        except TimeoutError as e:
+            raise LLMTimeoutError(
+                f"LLM call exceeded the {deadline:.0f}s turn deadline"
+            ) from e
+
+    async def _take_screenshot(self, custom_id: str) -> None:
+        """Save a screenshot of the current game state for the given request."""
+        assert self._balatro is not None
+        assert self._collector is not None
+
+        try:
+            await self._balatro.call(
+                "screenshot",
+                {"path": str(self._collector.screenshot_dir / f"{custom_id}.png")},
+            )
+        except BalatroError as e:
+            logger.warning(f"Screenshot failed: {e}")
+
     async def _execute_tool_call(self, response: ChatCompletion) -> dict[str, Any]:
         """Execute tool call from LLM response."""
         assert self._balatro is not None
@@ -329,8 +487,8 @@ class Bot:
             return await self._handle_error_call("Invalid tool call: missing arguments")
 
         try:
-            fn_args = json.loads(fn_args_str)
-        except json.JSONDecodeError as e:
+            fn_args = orjson.loads(fn_args_str)
+        except orjson.JSONDecodeError as e:
             return await self._handle_error_call(
                 f"Invalid JSON in tool call arguments: {e}"
             )
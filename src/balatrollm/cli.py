@@ -4,6 +4,7 @@ import argparse
 import asyncio
 import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 from .config import Config, Task
@@ -42,6 +43,11 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument("--port", type=int, help="Starting port")
     parser.add_argument("--base-url", help="LLM API base URL")
     parser.add_argument("--api-key", help="LLM API key")
+    parser.add_argument(
+        "--message-format",
+        choices=["auto", "text", "chunks"],
+        help="Prompt layout: single string or content parts",
+    )
 
     # CLI-only
     parser.add_argument("--dry-run", action="store_true", help="Show tasks only")
@@ -64,14 +70,15 @@ async def execute(config: Config, tasks: list[Task]) -> int:
     from .executor import Executor
     from .views import ViewsServer
 
+    # Project root (where views/ and runs/ are located), resolved once
+    project_root = Path.cwd()
+
     views_server: ViewsServer | None = None
     if config.views:
-        # Serve from project root (where views/ and runs/ are located)
-        project_root = Path.cwd()
         views_server = ViewsServer(root_dir=project_root)
         views_server.start()
 
-    executor = Executor(config=config, tasks=tasks)
+    executor = Executor(config=config, tasks=tasks, runs_dir=project_root)
 
     try:
         await executor.run()
@@ -97,6 +104,16 @@ def _resolve_config_path(args_config: Path | None) -> Path | None:
     return None
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory if installed, else None (default loop)."""
+    try:
+        # Optional extra (balatrollm[uvloop]); not installed in dev/test envs
+        import uvloop  # ty: ignore[unresolved-import]
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main() -> None:
     """Main entry point for balatrollm command."""
     parser = create_parser()
@@ -122,7 +139,7 @@ def main() -> None:
 
     # Execute
     try:
-        exit_code = asyncio.run(execute(config, tasks))
+        exit_code = asyncio.run(execute(config, tasks), loop_factory=_loop_factory())
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\nInterrupted by user")
@@ -1,21 +1,48 @@
 """Async JSON-RPC 2.0 HTTP client for communicating with BalatroBot."""
 
+import itertools
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
 import httpx
+import orjson
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# httpx defaults that BalatroBot ignores; dropped to keep each request small
+_UNUSED_DEFAULT_HEADERS = ("Accept", "Accept-Encoding", "User-Agent")
+
+# Shared params for parameterless calls (serialized immediately, never mutated)
+_EMPTY_PARAMS: dict[str, Any] = {}
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create an HTTP client that can be shared by several BalatroClients.
+
+    Requests carry their own URL and timeout, so one client (and its connection
+    pool: one keep-alive connection per BalatroBot port, kept open across runs)
+    can serve every instance. The caller owns the client and must close it.
+    """
+    # No keep-alive cap: each parallel instance holds one idle connection
+    client = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=None))
+    for name in _UNUSED_DEFAULT_HEADERS:
+        del client.headers[name]
+    return client
 
 
 class BalatroError(Exception):
     """Exception raised when BalatroBot returns an error response."""
 
     def __init__(
-        self, code: int, message: str, data: dict[Literal["name"], str]
+        self, code: int, message: str, data: dict[Literal["name"], str] | None = None
     ) -> None:
         self.code = code
         self.message = message
         self.data = data
-        super().__init__(f"[{data['name']}] {message}")
+        # A malformed error object must not mask the server's message
+        name = data.get("name", "UNKNOWN") if data else "UNKNOWN"
+        super().__init__(f"[{name}] {message}")
 
 
 @dataclass
@@ -25,23 +52,31 @@ class BalatroClient:
     host: str = "127.0.0.1"
     port: int = 12346
     timeout: float = 30.0
+    # Shared client from create_http_client(); if None, one is created and owned
+    http_client: httpx.AsyncClient | None = field(default=None, repr=False)
 
     _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
-    _request_id: int = field(default=0, init=False, repr=False)
+    _owns_client: bool = field(default=False, init=False, repr=False)
+    _url: str = field(default="", init=False, repr=False)
+    _request_ids: Iterator[int] = field(
+        default_factory=lambda: itertools.count(1), init=False, repr=False
+    )
 
     async def __aenter__(self) -> "BalatroClient":
-        """Create and configure the async HTTP client."""
-        self._client = httpx.AsyncClient(
-            base_url=f"http://{self.host}:{self.port}",
-            timeout=self.timeout,
-        )
+        """Attach the given HTTP client, or create one owned by this client."""
+        self._owns_client = self.http_client is None
+        if self.http_client is None:
+            self._client = create_http_client()
+        else:
+            self._client = self.http_client
+        self._url = f"http://{self.host}:{self.port}/"
         return self
 
     async def __aexit__(self, *_: Any) -> None:
-        """Close the async HTTP client."""
-        if self._client is not None:
+        """Close the HTTP client if this client created it."""
+        if self._client is not None and self._owns_client:
             await self._client.aclose()
-            self._client = None
+        self._client = None
 
     async def call(self, method: str, params: dict[str, Any] | None = None) -> Any:
         """Send a JSON-RPC 2.0 request and return the result."""
@@ -50,22 +85,26 @@ class BalatroClient:
                 "Client not connected. Use 'async with BalatroClient() as client:'"
             )
 
-        self._request_id += 1
         payload = {
             "jsonrpc": "2.0",
             "method": method,
-            "params": params or {},
-            "id": self._request_id,
+            "params": params or _EMPTY_PARAMS,
+            "id": next(self._request_ids),
         }
-        response = await self._client.post("/", json=payload)
-        data = response.json()
+        response = await self._client.post(
+            self._url,
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=self.timeout,
+        )
+        data = orjson.loads(response.content)
 
         if "error" in data:
             error = data["error"]
             raise BalatroError(
                 code=error["code"],
                 message=error["message"],
-                data=error["data"],
+                data=error.get("data"),
             )
 
         return data["result"]
@@ -1,17 +1,34 @@
 """Data collection and statistics for BalatroLLM runs."""
 
-import json
-import statistics
-from collections import Counter
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
+import functools
+import logging
+import math
+import os
+import queue
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, BinaryIO, Literal
+
+import orjson
 
 from . import __version__
 from .config import Task
 from .strategy import StrategyManifest
 
+logger = logging.getLogger(__name__)
+
+# Last batch.json written by this process, keyed by path:
+# ((mtime_ns, size), contents). Later runs reuse the parsed copy unless another
+# process changed the file (size guards against coarse mtime resolution).
+_BATCH_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+# Process umask (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 # Type alias for run finish reasons
 FinishReason = Literal[
     # Normal exits
@@ -29,32 +46,99 @@ FinishReason = Literal[
 ]
 
 
+def _split_model(model: str) -> tuple[str, str]:
+    """Split "vendor/model" into (vendor, model); unprefixed models are "other"."""
+    if "/" in model:
+        vendor, name = model.split("/", 1)
+        return vendor, name
+    return "other", model
+
+
+@functools.lru_cache(maxsize=32)
+def _manifest_json(strategy: str) -> bytes:
+    """Load and serialize a strategy manifest once per process."""
+    manifest = StrategyManifest.from_file(strategy)
+    return orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Replace a file's contents so concurrent readers never see a partial file."""
+    # Unique temp name: parallel runs may replace the same file at once
+    f = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with f:
+            f.write(data)
+        # NamedTemporaryFile creates 0600 files; keep the usual umask-based mode
+        os.chmod(f.name, 0o666 & ~_UMASK)
+        os.replace(f.name, path)
+    except BaseException:
+        Path(f.name).unlink(missing_ok=True)
+        raise
+
+
+def _read_last_line(path: Path, chunk_size: int = 4096) -> bytes:
+    """Return the last non-empty line of a file, reading backwards from the end."""
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+            stripped = tail.rstrip(b"\n")
+            # Stop once a newline precedes the last line's content
+            if b"\n" in stripped:
+                return stripped.rsplit(b"\n", 1)[1]
+        return tail.rstrip(b"\n")
+
+
 def _generate_run_dir(task: Task, base_dir: Path) -> Path:
     """Generate unique run directory path."""
-    if "/" in task.model:
-        vendor, model = task.model.split("/", 1)
-    else:
-        vendor, model = "other", task.model
+    vendor, model = _split_model(task.model)
+    now_ms = time.time_ns() // 1_000_000
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now_ms // 1000))
     dir_name = "_".join(
         [
-            datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3],
+            f"{timestamp}_{now_ms % 1000:03d}",
             task.deck,
             task.stake,
             task.seed,
         ]
     )
-    return (
-        base_dir
-        / "runs"
-        / f"v{__version__}"
-        / task.strategy
-        / vendor
-        / model
-        / dir_name
+    # One joinpath call builds a single Path instead of one per "/" segment
+    return base_dir.joinpath(
+        "runs", f"v{__version__}", task.strategy, vendor, model, dir_name
     )
 
 
-@dataclass
+@dataclass(slots=True)
+class _RunningStat:
+    """Single-pass total, mean and sample variance (Welford's algorithm)."""
+
+    n: int = 0
+    total: float = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        self.total += x
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation, or 0.0 with fewer than two values."""
+        if self.n < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.n - 1))
+
+
+@dataclass(slots=True, frozen=True)
 class Stats:
     """Complete statistics for a game run (flat structure)."""
 
@@ -93,7 +177,7 @@ class Stats:
     cost_std: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatCompletionRequestInput:
     """OpenAI Batch API request format."""
 
@@ -103,7 +187,7 @@ class ChatCompletionRequestInput:
     body: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatCompletionResponse:
     """OpenAI Batch API response format."""
 
@@ -112,7 +196,7 @@ class ChatCompletionResponse:
     body: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatCompletionError:
     """Error information for failed requests."""
 
@@ -120,7 +204,7 @@ class ChatCompletionError:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatCompletionRequestOutput:
     """OpenAI Batch API response output format."""
 
@@ -163,6 +247,8 @@ class Collector:
         self.task = task
         self._base_dir = base_dir
         self._request_count = 0
+        self._responses_written = 0
+        self._gamestates_written = 0
 
         # Call tracking
         self._calls_success = 0
@@ -180,23 +266,41 @@ class Collector:
         self._total_tokens: int = 0
         self._total_cost: float = 0.0
 
+        # JSONL files kept open for the whole run (opened on first write) and
+        # written by a background thread so disk I/O stays off the event loop
+        self._jsonl_files: dict[str, BinaryIO] = {}
+        self._write_queue: queue.Queue[tuple[str, bytes] | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+
+        # Vendor and model name, split once for task/batch/previous.json
+        self._vendor, self._model_name = _split_model(task.model)
+
         # Write task with structured model for benchmark analysis
-        if "/" in task.model:
-            vendor, model_name = task.model.split("/", 1)
-        else:
-            vendor, model_name = "other", task.model
         task_data = {
-            "model": {"vendor": vendor, "name": model_name},
+            "model": {"vendor": self._vendor, "name": self._model_name},
             "seed": task.seed,
             "deck": task.deck,
             "stake": task.stake,
             "strategy": task.strategy,
         }
-        manifest = StrategyManifest.from_file(task.strategy)
-        with (self.run_dir / "task.json").open("w") as f:
-            json.dump(task_data, f, indent=2)
-        with (self.run_dir / "strategy.json").open("w") as f:
-            json.dump(asdict(manifest), f, indent=2)
+        manifest_json = _manifest_json(task.strategy)
+        (self.run_dir / "task.json").write_bytes(
+            orjson.dumps(task_data, option=orjson.OPT_INDENT_2)
+        )
+        (self.run_dir / "strategy.json").write_bytes(manifest_json)
+
+        # Static part of latest.json, encoded once; only the failure count and
+        # finish reason change during a run (trailing "}" left open)
+        relative_run_path = self.run_dir.relative_to(base_dir / "runs")
+        self._latest_prefix = orjson.dumps(
+            {
+                "task": str(relative_run_path / "task.json"),
+                "responses": str(relative_run_path / "responses.jsonl"),
+                "requests": str(relative_run_path / "requests.jsonl"),
+                "gamestates": str(relative_run_path / "gamestates.jsonl"),
+                "max_failures": self.MAX_CONSECUTIVE_FAILURES,
+            }
+        )[:-1]
 
         # Write latest.json pointer for overlay
         self._write_latest_json()
@@ -220,7 +324,9 @@ class Collector:
         self._write_latest_json()
 
     def reset_failures(self) -> None:
-        """Reset consecutive failure count and update latest.json."""
+        """Reset consecutive failure count and update latest.json if it changed."""
+        if self._consecutive_failures == 0:
+            return
         self._consecutive_failures = 0
         self._write_latest_json()
 
@@ -231,29 +337,20 @@ class Collector:
 
     def _write_latest_json(self) -> None:
         """Write latest.json pointer for overlay."""
-        runs_dir = self._base_dir / "runs"
-        relative_run_path = self.run_dir.relative_to(runs_dir)
-        with (runs_dir / "latest.json").open("w") as f:
-            json.dump(
-                {
-                    "task": str(relative_run_path / "task.json"),
-                    "responses": str(relative_run_path / "responses.jsonl"),
-                    "requests": str(relative_run_path / "requests.jsonl"),
-                    "gamestates": str(relative_run_path / "gamestates.jsonl"),
-                    "consecutive_failures": self._consecutive_failures,
-                    "max_failures": self.MAX_CONSECUTIVE_FAILURES,
-                    "finish_reason": self._finish_reason,
-                },
-                f,
-            )
+        latest = b'%b,"consecutive_failures":%d,"finish_reason":%b}' % (
+            self._latest_prefix,
+            self._consecutive_failures,
+            orjson.dumps(self._finish_reason),
+        )
+        # The overlay polls latest.json, so never expose a half-written file
+        _write_atomic(self._base_dir / "runs" / "latest.json", latest)
 
     def write_request(self, body: dict[str, Any]) -> str:
         """Write request to requests.jsonl. Returns custom_id."""
         self._request_count += 1
         custom_id = f"request-{self._request_count:05}"
         req = ChatCompletionRequestInput(custom_id=custom_id, body=body)
-        with (self.run_dir / "requests.jsonl").open("a") as f:
-            f.write(json.dumps(asdict(req)) + "\n")
+        self._append_jsonl("requests.jsonl", req)
         return custom_id
 
     def write_response(
@@ -270,8 +367,8 @@ class Collector:
             response=response,
             error=error,
         )
-        with (self.run_dir / "responses.jsonl").open("a") as f:
-            f.write(json.dumps(asdict(res)) + "\n")
+        self._append_jsonl("responses.jsonl", res)
+        self._responses_written += 1
 
         # Track tokens and cost for batch.json
         if response is not None and response.status_code == 200:
@@ -283,14 +380,62 @@ class Collector:
 
     def write_gamestate(self, gamestate: dict[str, Any]) -> None:
         """Write gamestate to gamestates.jsonl."""
-        with (self.run_dir / "gamestates.jsonl").open("a") as f:
-            f.write(json.dumps(gamestate) + "\n")
+        self._append_jsonl("gamestates.jsonl", gamestate)
+        self._gamestates_written += 1
+
+    def _append_jsonl(self, name: str, record: Any) -> None:
+        """Queue a record for the background writer of a run JSONL file."""
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="collector-writer", daemon=True
+            )
+            self._writer.start()
+        # Serialize here: the caller may reuse the record once this returns.
+        # orjson appends the newline itself, avoiding a copy of the whole line
+        line = orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        self._write_queue.put((name, line))
+
+    def _writer_loop(self) -> None:
+        """Write queued lines until the close sentinel, then close the files."""
+        try:
+            while (item := self._write_queue.get()) is not None:
+                try:
+                    name, line = item
+                    f = self._jsonl_files.get(name)
+                    if f is None:
+                        f = self._jsonl_files[name] = (self.run_dir / name).open("ab")
+                    f.write(line)
+                    # Flush every line: the views overlay tails these files live
+                    f.flush()
+                except OSError:
+                    logger.exception(f"Could not write to {name}")
+                finally:
+                    self._write_queue.task_done()
+            self._write_queue.task_done()
+        finally:
+            for f in self._jsonl_files.values():
+                f.close()
+            self._jsonl_files.clear()
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        if self._writer is not None:
+            self._write_queue.join()
+
+    def close(self) -> None:
+        """Write remaining records, stop the writer and close the JSONL files."""
+        if self._writer is None:
+            return
+        self._write_queue.put(None)
+        self._writer.join()
+        self._writer = None
 
     def write_stats(self, finish_reason: FinishReason) -> None:
         """Calculate and write final statistics to stats.json."""
         stats = self._calculate_stats(finish_reason)
-        with (self.run_dir / "stats.json").open("w") as f:
-            json.dump(asdict(stats), f, indent=2)
+        _write_atomic(
+            self.run_dir / "stats.json", orjson.dumps(stats, option=orjson.OPT_INDENT_2)
+        )
         # Update batch.json with best run info
         self._update_batch_json(stats.final_ante, stats.final_round, finish_reason)
         # Write previous.json for the overlay
@@ -304,9 +449,19 @@ class Collector:
         """Update batch.json with best run info."""
         batch_path = self._base_dir / "runs" / "batch.json"
 
-        # Load existing or create new
-        if batch_path.exists():
-            batch: dict[str, Any] = json.loads(batch_path.read_text())
+        # Load existing (from the in-process copy when the file is unchanged)
+        # or create new
+        try:
+            st = batch_path.stat()
+            signature = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            signature = None
+        cached = _BATCH_CACHE.get(batch_path)
+        if cached is not None and cached[0] == signature:
+            # Copy: the cache must only change once the write below succeeds
+            batch: dict[str, Any] = dict(cached[1])
+        elif signature is not None:
+            batch = orjson.loads(batch_path.read_bytes())
         else:
             batch = {
                 "best_ante": 0,
@@ -331,14 +486,10 @@ class Collector:
         if final_ante > best_ante or (
             final_ante == best_ante and final_round > best_round
         ):
-            if "/" in self.task.model:
-                vendor, model = self.task.model.split("/", 1)
-            else:
-                vendor, model = "other", self.task.model
             batch["best_ante"] = final_ante
             batch["best_round"] = final_round
-            batch["best_vendor"] = vendor
-            batch["best_model"] = model
+            batch["best_vendor"] = self._vendor
+            batch["best_model"] = self._model_name
             batch["best_seed"] = self.task.seed
             batch["best_deck"] = self.task.deck
             batch["best_stake"] = self.task.stake
@@ -347,20 +498,17 @@ class Collector:
             batch["best_finish_reason"] = finish_reason
 
         batch["runs_completed"] = runs_completed + 1
-        batch_path.write_text(json.dumps(batch, indent=2))
+        _write_atomic(batch_path, orjson.dumps(batch, option=orjson.OPT_INDENT_2))
+        st = batch_path.stat()
+        _BATCH_CACHE[batch_path] = ((st.st_mtime_ns, st.st_size), batch)
 
     def _write_previous(
         self, finish_reason: FinishReason, final_ante: int, final_round: int
     ) -> None:
         """Write previous.json for the completed run."""
-        if "/" in self.task.model:
-            vendor, model = self.task.model.split("/", 1)
-        else:
-            vendor, model = "other", self.task.model
-
         previous = {
-            "vendor": vendor,
-            "model": model,
+            "vendor": self._vendor,
+            "model": self._model_name,
             "seed": self.task.seed,
             "deck": self.task.deck,
             "stake": self.task.stake,
@@ -370,57 +518,58 @@ class Collector:
             "cost": self._total_cost,
             "finish_reason": finish_reason,
         }
-        (self._base_dir / "runs" / "previous.json").write_text(
-            json.dumps(previous, indent=2)
+        _write_atomic(
+            self._base_dir / "runs" / "previous.json",
+            orjson.dumps(previous, option=orjson.OPT_INDENT_2),
         )
 
     def _calculate_stats(self, finish_reason: FinishReason) -> Stats:
         """Calculate statistics from collected data."""
+        # Checked from in-memory counters, before touching the files
+        if self._gamestates_written == 0 or self._responses_written == 0:
+            raise RuntimeError(
+                "Cannot calculate stats: no gamestates or responses were recorded"
+            )
+        self.flush()
 
         ################################################################################
-        # Load gamestates and responses
+        # Load the final gamestate (earlier ones are not needed)
         ################################################################################
 
-        gamestates_path = self.run_dir / "gamestates.jsonl"
-        with gamestates_path.open() as f:
-            gamestates = [json.loads(line) for line in f]
-        assert len(gamestates) >= 1, "Expected at least one gamestate"
-        responses_path = self.run_dir / "responses.jsonl"
-        with responses_path.open() as f:
-            responses = [
-                ChatCompletionRequestOutput.from_dict(json.loads(line)) for line in f
-            ]
-        assert len(responses) >= 2, "Expected at least two responses"
+        gamestate = orjson.loads(_read_last_line(self.run_dir / "gamestates.jsonl"))
 
         ################################################################################
-        # Populate lists for each stat type and count providers
+        # Stream responses into running stats and count providers
         ################################################################################
 
-        provider_counts: Counter[str] = Counter()
-        input_tokens: list[int] = []
-        output_tokens: list[int] = []
-        total_costs: list[float] = []
-        time_ms_list: list[int] = []
+        provider_counts: dict[str, int] = {}
+        tokens_in = _RunningStat()
+        tokens_out = _RunningStat()
+        cost = _RunningStat()
+        time_ms = _RunningStat()
 
-        for res in responses:
-            if res.response is not None and res.response.status_code == 200:
-                body = res.response.body
+        responses_path = self.run_dir / "responses.jsonl"
+        with responses_path.open("rb") as f:
+            for line in f:
+                res = orjson.loads(line)
+                response = res.get("response")
+                if not response or response["status_code"] != 200:
+                    continue
+                body = response["body"]
                 if "provider" in body:
-                    provider_counts[body["provider"]] += 1
+                    provider = body["provider"]
+                    provider_counts[provider] = provider_counts.get(provider, 0) + 1
 
                 usage = body.get("usage", {})
-                input_tokens.append(usage.get("prompt_tokens", 0))
-                output_tokens.append(usage.get("completion_tokens", 0))
-                total_costs.append(usage.get("cost", 0))
-                time_ms_list.append(int(res.id) - int(res.response.request_id))
+                tokens_in.add(usage.get("prompt_tokens", 0))
+                tokens_out.add(usage.get("completion_tokens", 0))
+                cost.add(usage.get("cost", 0))
+                time_ms.add(int(res["id"]) - int(response["request_id"]))
 
         ################################################################################
         # Compute aggregated stats
         ################################################################################
 
-        n = len(input_tokens)
-        gamestate = gamestates[-1]
-
         return Stats(
             # Outcome
             run_won=gamestate["won"],
@@ -429,25 +578,25 @@ class Collector:
             final_round=gamestate["round_num"],
             finish_reason=finish_reason,
             # Provider distribution
-            providers=dict(provider_counts),
+            providers=provider_counts,
             # Call statistics
             calls_total=self._calls_total,
             calls_success=self._calls_success,
             calls_error=self._calls_error,
             calls_failed=self._calls_failed,
             # Token statistics
-            tokens_in_total=sum(input_tokens),
-            tokens_out_total=sum(output_tokens),
-            tokens_in_avg=sum(input_tokens) / n,
-            tokens_out_avg=sum(output_tokens) / n,
-            tokens_in_std=statistics.stdev(input_tokens),
-            tokens_out_std=statistics.stdev(output_tokens),
+            tokens_in_total=int(tokens_in.total),
+            tokens_out_total=int(tokens_out.total),
+            tokens_in_avg=tokens_in.mean,
+            tokens_out_avg=tokens_out.mean,
+            tokens_in_std=tokens_in.stdev,
+            tokens_out_std=tokens_out.stdev,
             # Timing statistics
-            time_total_ms=sum(time_ms_list),
-            time_avg_ms=sum(time_ms_list) / n,
-            time_std_ms=statistics.stdev(time_ms_list),
+            time_total_ms=int(time_ms.total),
+            time_avg_ms=time_ms.mean,
+            time_std_ms=time_ms.stdev,
             # Cost statistics
-            cost_total=sum(total_costs),
-            cost_avg=sum(total_costs) / n,
-            cost_std=statistics.stdev(total_costs),
+            cost_total=cost.total,
+            cost_avg=cost.mean,
+            cost_std=cost.stdev,
         )
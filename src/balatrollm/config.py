@@ -3,6 +3,7 @@
 import os
 from argparse import Namespace
 from dataclasses import dataclass, field
+from itertools import product
 from pathlib import Path
 from typing import Any, Self
 
@@ -10,6 +11,9 @@ import yaml
 
 STRATEGIES_DIR = Path(__file__).parent / "strategies"
 
+# libyaml-backed loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 ################################################################################
 # Default model configuration
@@ -42,6 +46,7 @@ ENV_MAP: dict[str, str] = {
     "base_url": "BALATROLLM_BASE_URL",
     "api_key": "BALATROLLM_API_KEY",
     "views": "BALATROLLM_VIEWS",
+    "message_format": "BALATROLLM_MESSAGE_FORMAT",
 }
 
 ################################################################################
@@ -50,8 +55,12 @@ ENV_MAP: dict[str, str] = {
 
 BOOL_FIELDS: frozenset[str] = frozenset({"views"})
 LIST_FIELDS: frozenset[str] = frozenset({"model", "seed", "deck", "stake", "strategy"})
-STRING_FIELDS: frozenset[str] = frozenset({"host", "base_url", "api_key"})
+STRING_FIELDS: frozenset[str] = frozenset(
+    {"host", "base_url", "api_key", "message_format"}
+)
 INT_FIELDS: frozenset[str] = frozenset({"parallel", "port"})
+# Fields copied as-is from YAML and CLI args
+SCALAR_FIELDS: frozenset[str] = INT_FIELDS | STRING_FIELDS
 
 ################################################################################
 # Enums for config validation
@@ -68,6 +77,10 @@ VALID_STAKES: frozenset[str] = frozenset(
 )
 # fmt: on
 
+# "text": single string per message; "chunks": list of content parts;
+# "auto": "chunks" for Anthropic models (explicit prompt caching), else "text"
+VALID_MESSAGE_FORMATS: frozenset[str] = frozenset({"auto", "text", "chunks"})
+
 
 def _ensure_list(value: None | str | list[str]) -> list[str]:
     """Ensure value is a list of strings."""
@@ -93,12 +106,11 @@ def _parse_env_value(field_name: str, value: str) -> bool | int | str | list:
 
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     """Deep merge override into base"""
-    result = base.copy()
+    result = base | override
+    # Only keys that are dicts on both sides need a nested merge
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            result[key] = _deep_merge(base[key], value)
     return result
 
 
@@ -120,17 +132,17 @@ def _load_from_env() -> dict[str, Any]:
 
 def _load_from_yaml(path: Path) -> dict[str, Any]:
     """Load config from YAML file."""
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-
-    with path.open() as f:
-        data = yaml.safe_load(f) or {}
+    try:
+        with path.open("rb") as f:
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Config file not found: {path}") from e
 
     result: dict[str, Any] = {}
     for field_name in LIST_FIELDS:
         if field_name in data:
             result[field_name] = _ensure_list(data[field_name])
-    for field_name in INT_FIELDS | STRING_FIELDS:
+    for field_name in SCALAR_FIELDS:
         if field_name in data:
             result[field_name] = data[field_name]
     if "model_config" in data and isinstance(data["model_config"], dict):
@@ -144,7 +156,7 @@ def _load_from_args(args: Namespace) -> dict[str, Any]:
     for field_name in LIST_FIELDS:
         if (val := getattr(args, field_name, None)) is not None:
             result[field_name] = val if isinstance(val, list) else [val]
-    for field_name in INT_FIELDS | STRING_FIELDS:
+    for field_name in SCALAR_FIELDS:
         if (val := getattr(args, field_name, None)) is not None:
             result[field_name] = val
     for field_name in BOOL_FIELDS:
@@ -170,7 +182,7 @@ class Task:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Bot configuration with list support for game parameters."""
 
@@ -191,9 +203,17 @@ class Config:
     base_url: str = "https://openrouter.ai/api/v1"
     api_key: str | None = None
 
+    # Prompt layout ("chunks" is required for per-part `cache_control` hints)
+    message_format: str = "auto"
+
     # Model config (merged with DEFAULT_MODEL_CONFIG)
     model_config: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Deck and stake names are case-insensitive; normalize once here
+        self.deck = [deck.upper() for deck in self.deck]
+        self.stake = [stake.upper() for stake in self.stake]
+
     @classmethod
     def load(
         cls,
@@ -233,13 +253,17 @@ class Config:
         if self.port < 1 or self.port > 65535:
             raise ValueError("port must be between 1 and 65535")
 
-        for deck in self.deck:
-            if deck not in VALID_DECKS:
-                raise ValueError(f"Invalid deck: {deck}. Valid: {VALID_DECKS}")
+        if invalid := [deck for deck in self.deck if deck not in VALID_DECKS]:
+            raise ValueError(f"Invalid deck: {invalid[0]}. Valid: {VALID_DECKS}")
+
+        if invalid := [stake for stake in self.stake if stake not in VALID_STAKES]:
+            raise ValueError(f"Invalid stake: {invalid[0]}. Valid: {VALID_STAKES}")
 
-        for stake in self.stake:
-            if stake.upper() not in VALID_STAKES:
-                raise ValueError(f"Invalid stake: {stake}. Valid: {VALID_STAKES}")
+        if self.message_format not in VALID_MESSAGE_FORMATS:
+            raise ValueError(
+                f"Invalid message_format: {self.message_format}. "
+                f"Valid: {VALID_MESSAGE_FORMATS}"
+            )
 
         for strategy in self.strategy:
             strategy_path = STRATEGIES_DIR / strategy
@@ -248,25 +272,13 @@ class Config:
 
     def generate_tasks(self) -> list[Task]:
         """Generate all run combinations as Tasks."""
-        tasks: list[Task] = []
-
         # Order: strategy → model → deck → stake → seed
-        for strategy in self.strategy:
-            for model in self.model:
-                for deck in self.deck:
-                    for stake in self.stake:
-                        for seed in self.seed:
-                            tasks.append(
-                                Task(
-                                    model=model,
-                                    seed=seed,
-                                    deck=deck.upper(),
-                                    stake=stake.upper(),
-                                    strategy=strategy,
-                                )
-                            )
-
-        return tasks
+        return [
+            Task(model=model, seed=seed, deck=deck, stake=stake, strategy=strategy)
+            for strategy, model, deck, stake, seed in product(
+                self.strategy, self.model, self.deck, self.stake, self.seed
+            )
+        ]
 
     @property
     def total_runs(self) -> int:
@@ -1,18 +1,27 @@
 """Task execution for BalatroLLM runs."""
 
 import asyncio
+import contextlib
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import httpx
+import openai
 from balatrobot import BalatroInstance
 from balatrobot import Config as BalatrobotConfig
 
 from .bot import Bot
+from .client import create_http_client
 from .config import Config, Task
+from .llm import create_openai_client
 
 logger = logging.getLogger(__name__)
 
+# Upper bound (seconds) for the backoff between runs after consecutive failures
+MAX_RETRY_DELAY = 30.0
+
 
 @dataclass
 class Executor:
@@ -25,12 +34,10 @@ class Executor:
     _instances: dict[int, BalatroInstance] = field(
         default_factory=dict, init=False, repr=False
     )
-    _port_pool: asyncio.Queue[int] = field(
-        default_factory=asyncio.Queue, init=False, repr=False
-    )
-    _shutdown: asyncio.Event = field(
-        default_factory=asyncio.Event, init=False, repr=False
+    _queues: dict[int, deque[Task]] = field(
+        default_factory=dict, init=False, repr=False
     )
+    _started: int = field(default=0, init=False, repr=False)
 
     async def run(self) -> None:
         """Execute all tasks."""
@@ -58,10 +65,9 @@ class Executor:
         # Start all instances in parallel
         await asyncio.gather(*(instance.start() for _, instance in instances))
 
-        # Register instances in pool
+        # Register instances
         for port, instance in instances:
             self._instances[port] = instance
-            await self._port_pool.put(port)
 
     async def _stop_instances(self) -> None:
         """Stop all instances."""
@@ -72,43 +78,109 @@ class Executor:
         self._instances.clear()
 
     async def _execute_tasks(self) -> None:
-        """Execute tasks with port pool."""
+        """Execute tasks with one worker per port."""
+        # Seed per-worker queues round-robin; idle workers steal from the others
+        ports = list(self._instances)
+        self._queues = {
+            port: deque(self.tasks[i :: len(ports)]) for i, port in enumerate(ports)
+        }
+
+        # One BalatroBot HTTP client and one OpenAI client for every port keep
+        # connections open across runs; both are closed after the workers end.
+        # Cancelling this coroutine cancels and awaits every worker first.
+        async with (
+            create_http_client() as http_client,
+            create_openai_client(
+                self.config.base_url, self.config.api_key or ""
+            ) as openai_client,
+            asyncio.TaskGroup() as tg,
+        ):
+            for port in ports:
+                tg.create_task(self._port_worker(port, http_client, openai_client))
+
+    def _next_task(self, port: int) -> Task | None:
+        """Pop the next task for a worker, stealing half of the largest peer queue."""
+        own = self._queues[port]
+        if not own:
+            victim = max(self._queues.values(), key=lambda q: len(q))
+            # Steal from the tail: the owner keeps consuming from the head
+            for _ in range((len(victim) + 1) // 2):
+                own.appendleft(victim.pop())
+        return own.popleft() if own else None
+
+    async def _port_worker(
+        self,
+        port: int,
+        http_client: httpx.AsyncClient,
+        openai_client: openai.AsyncOpenAI,
+    ) -> None:
+        """Run tasks on a single Balatro instance until all queues are empty."""
+        task = self._next_task(port)
+        if task is None:
+            return
+
+        # Contain worker failures so the TaskGroup does not cancel other ports;
+        # tasks left in this worker's queue are stolen by the remaining workers
+        try:
+            await self._play_tasks(port, task, http_client, openai_client)
+        except Exception:
+            logger.exception(f"Worker on port {port} failed")
+
+    async def _play_tasks(
+        self,
+        port: int,
+        task: Task,
+        http_client: httpx.AsyncClient,
+        openai_client: openai.AsyncOpenAI,
+    ) -> None:
+        """Play tasks with one bot for this port, starting with `task`."""
         total = len(self.tasks)
-        count = 0
+        width = len(str(total))
+        log_path = self._instances[port].log_path
 
-        async def run_task(task: Task) -> None:
-            nonlocal count
-            if self._shutdown.is_set():
-                return
-            port = await self._port_pool.get()
+        # Back off only after failed runs: 1s, 2s, 4s, ... up to MAX_RETRY_DELAY
+        delay = 0.0
+
+        # One bot per port, reset between runs to reuse clients and templates
+        async with contextlib.AsyncExitStack() as stack:
             try:
-                count += 1
-                instance = self._instances[port]
-                log_path = instance.log_path
-                print(
-                    f"[{count:0{len(str(total))}d}/{total}] STARTED   | {log_path} | {task}"
-                )
-                bot = Bot(task=task, config=self.config, port=port)
-                async with bot:
-                    await bot.play(self.runs_dir)
-                print(
-                    f"[{count:0{len(str(total))}d}/{total}] COMPLETED | {log_path} | {task}"
+                bot = await stack.enter_async_context(
+                    Bot(
+                        task=task,
+                        config=self.config,
+                        port=port,
+                        http_client=http_client,
+                        openai_client=openai_client,
+                    )
                 )
             except Exception:
-                logger.exception(f"Run failed: {task}")
-                print(
-                    f"[{count:0{len(str(total))}d}/{total}] ERROR     | {log_path} | {task}"
-                )
-            finally:
-                await asyncio.sleep(1)
-                await self._port_pool.put(port)
-
-        pending = [asyncio.create_task(run_task(t)) for t in self.tasks]
-        try:
-            await asyncio.gather(*pending, return_exceptions=True)
-        except asyncio.CancelledError:
-            self._shutdown.set()
-            for t in pending:
-                t.cancel()
-            await asyncio.gather(*pending, return_exceptions=True)
-            raise
+                # The bot never started: count its first task as a failed run
+                self._started += 1
+                count = self._started
+                print(f"[{count:0{width}d}/{total}] ERROR     | {log_path} | {task}")
+                raise
+            while True:
+                self._started += 1
+                count = self._started
+                try:
+                    bot.reset(task)
+                    print(
+                        f"[{count:0{width}d}/{total}] STARTED   | {log_path} | {task}"
+                    )
+                    await bot.play(self.runs_dir)
+                    print(
+                        f"[{count:0{width}d}/{total}] COMPLETED | {log_path} | {task}"
+                    )
+                    delay = 0.0
+                except Exception:
+                    logger.exception(f"Run failed: {task}")
+                    print(
+                        f"[{count:0{width}d}/{total}] ERROR     | {log_path} | {task}"
+                    )
+                    delay = min(delay * 2 or 1.0, MAX_RETRY_DELAY)
+                if delay:
+                    await asyncio.sleep(delay)
+                next_task = self._next_task(port)
+                if next_task is None:
+                    return
+                task = next_task
@@ -11,6 +11,23 @@ from openai.types.chat import ChatCompletion
 
 logger = logging.getLogger(__name__)
 
+# We assume that LLMs respond in 240s
+DEFAULT_TIMEOUT = 240.0
+
+# Cap on the openai SDK's backoff between its own retries of a single request
+SDK_MAX_RETRY_DELAY = 8.0
+
+
+def create_openai_client(
+    base_url: str, api_key: str, timeout: float = DEFAULT_TIMEOUT
+) -> openai.AsyncOpenAI:
+    """Create an AsyncOpenAI client that can be shared by several LLMClients.
+
+    Reusing one client across bots keeps its connection pool (and TLS sessions)
+    warm. The caller owns the client and must close it.
+    """
+    return openai.AsyncOpenAI(base_url=base_url, api_key=api_key, timeout=timeout)
+
 
 class LLMClientError(Exception):
     """Base exception for LLM client errors."""
@@ -36,27 +53,32 @@ class LLMClient:
 
     base_url: str
     api_key: str
-    timeout: float = 240.0  # We assume that LLMs respond in 240s
+    timeout: float = DEFAULT_TIMEOUT
     max_retries: int = 3
+    # Shared client from create_openai_client(); if None, one is created and owned
+    openai_client: openai.AsyncOpenAI | None = field(default=None, repr=False)
 
     _client: openai.AsyncOpenAI | None = field(default=None, init=False, repr=False)
+    _owns_client: bool = field(default=False, init=False, repr=False)
     _consecutive_timeouts: int = field(default=0, init=False, repr=False)
 
     async def __aenter__(self) -> "LLMClient":
-        """Create the async OpenAI client."""
-        self._client = openai.AsyncOpenAI(
-            base_url=self.base_url,
-            api_key=self.api_key,
-            timeout=self.timeout,
-        )
+        """Attach the given OpenAI client, or create one owned by this client."""
+        self._owns_client = self.openai_client is None
+        if self.openai_client is None:
+            self._client = create_openai_client(
+                self.base_url, self.api_key, self.timeout
+            )
+        else:
+            self._client = self.openai_client
         self._consecutive_timeouts = 0
         return self
 
     async def __aexit__(self, *_: Any) -> None:
-        """Close the async OpenAI client."""
-        if self._client is not None:
+        """Close the OpenAI client if this client created it."""
+        if self._client is not None and self._owns_client:
             await self._client.close()
-            self._client = None
+        self._client = None
 
     async def call(
         self,
@@ -139,6 +161,14 @@ class LLMClient:
         """Get current consecutive timeout count."""
         return self._consecutive_timeouts
 
+    @property
+    def sdk_max_retries(self) -> int:
+        """Get the retries the openai SDK makes within each call attempt."""
+        client = self._client or self.openai_client
+        if client is None:
+            return openai.DEFAULT_MAX_RETRIES
+        return client.max_retries
+
     def reset_timeout_counter(self) -> None:
         """Reset the consecutive timeout counter."""
         self._consecutive_timeouts = 0
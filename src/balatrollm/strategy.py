@@ -1,16 +1,20 @@
 """Strategy template management for BalatroLLM."""
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import orjson
 from jinja2 import Environment, FileSystemLoader
 
 STRATEGIES_DIR = Path(__file__).parent / "strategies"
 
+REQUIRED_MANIFEST_FIELDS: frozenset[str] = frozenset(
+    {"name", "description", "author", "version", "tags"}
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StrategyManifest:
     """Strategy metadata from manifest.json."""
 
@@ -26,19 +30,18 @@ class StrategyManifest:
     ) -> "StrategyManifest":
         """Load strategy metadata from manifest.json."""
         manifest_path = strategies_dir / strategy / "manifest.json"
-        if not manifest_path.exists():
+        try:
+            data = orjson.loads(manifest_path.read_bytes())
+        except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"Manifest not found for strategy '{strategy}': {manifest_path}"
-            )
-
-        with manifest_path.open() as f:
-            data = json.load(f)
+            ) from e
 
-        required_fields = {"name", "description", "author", "version", "tags"}
-        missing_fields = required_fields - set(data.keys())
+        missing_fields = REQUIRED_MANIFEST_FIELDS.difference(data)
         if missing_fields:
             raise ValueError(
-                f"Manifest for strategy '{strategy}' missing fields: {missing_fields}"
+                f"Manifest for strategy '{strategy}' missing fields: "
+                f"{sorted(missing_fields)}"
             )
 
         return cls(
@@ -59,6 +62,12 @@ class StrategyManager:
     - MEMORY.md.jinja: Action history and error context
     - TOOLS.json: Tool definitions for each game state
 
+    The rendered strategy is sent first in every prompt so that providers can
+    reuse the KV cache of the shared prefix across turns. STRATEGY.md.jinja must
+    therefore render byte-identical output for every turn of a run: do not embed
+    turn-varying data (money, hand, round, timestamps...) in it; that belongs in
+    GAMESTATE.md.jinja or MEMORY.md.jinja.
+
     Usage:
         sm = StrategyManager("default")
         strategy_text = sm.render_strategy(gamestate)
@@ -94,15 +103,16 @@ class StrategyManager:
             raise FileNotFoundError(f"Strategy '{name}' missing files: {missing}")
 
         self.env = Environment(loader=FileSystemLoader(self.path))
-        self.env.filters["from_json"] = json.loads
+        self.env.filters["from_json"] = orjson.loads
 
         # Load tools
-        with open(self.path / "TOOLS.json") as f:
-            self._tools = json.load(f)
+        self._tools = orjson.loads((self.path / "TOOLS.json").read_bytes())
 
     def render_strategy(self, gamestate: dict[str, Any]) -> str:
         """Render the strategy guidance template.
 
+        The output must be stable across turns (see class docstring).
+
         Args:
             gamestate: Current game state from BalatroBot
 
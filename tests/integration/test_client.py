@@ -75,8 +75,8 @@ class TestBalatroClientGamestate:
         assert "state" in result2
         assert "state" in result3
 
-        # Request ID should increment
-        assert client._request_id == 3
+        # Request IDs 1-3 were used, so the next one should be 4
+        assert next(client._request_ids) == 4
 
 
 # ============================================================================
@@ -96,5 +96,6 @@ class TestBalatroClientErrors:
                 await client.call("nonexistent_method_xyz")
 
         error = exc_info.value
+        assert error.data is not None
         assert error.data["name"] == "BAD_REQUEST"
         assert error.message == "Unknown method: nonexistent_method_xyz"
@@ -0,0 +1,201 @@
+"""Unit tests for the Bot module (no Balatro or LLM server needed)."""
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from balatrollm.bot import Bot
+from balatrollm.config import Config, Task
+from balatrollm.llm import LLMTimeoutError
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+class StallingLLM:
+    """Stand-in for LLMClient whose call never returns until cancelled."""
+
+    def __init__(
+        self, timeout: float = 240.0, max_retries: int = 3, sdk_max_retries: int = 2
+    ) -> None:
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.sdk_max_retries = sdk_max_retries
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def call(self, **_: Any) -> Any:
+        self.started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+class StallingBalatro:
+    """Stand-in for BalatroClient whose requests never return until cancelled."""
+
+    def __init__(self) -> None:
+        self.cancelled: list[str] = []
+
+    async def call(self, method: str, params: dict[str, Any] | None = None) -> Any:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(method)
+            raise
+
+
+def make_bot(model: str = "openai/gpt-4", **config: Any) -> Bot:
+    """Create a bot without entering it (no clients are opened)."""
+    task = Task(
+        model=model,
+        seed="AAAAAAA",
+        deck="RED",
+        stake="WHITE",
+        strategy="default",
+    )
+    return Bot(task=task, config=Config(model=[model], **config))
+
+
+# ============================================================================
+# Test _build_messages
+# ============================================================================
+
+
+class TestBuildMessages:
+    """Tests for Bot._build_messages."""
+
+    def test_text_format_joins_content(self) -> None:
+        """Text format should send one string, strategy first."""
+        bot = make_bot(message_format="text")
+
+        messages = bot._build_messages("STRATEGY", "GAMESTATE", "MEMORY")
+
+        assert messages == [
+            {"role": "user", "content": "STRATEGY\n\nGAMESTATE\n\nMEMORY"}
+        ]
+
+    def test_chunks_format_caches_strategy_prefix(self) -> None:
+        """Chunks format should send parts with the strategy marked cacheable."""
+        bot = make_bot(message_format="chunks")
+
+        messages = bot._build_messages("STRATEGY", "GAMESTATE", "MEMORY")
+
+        assert len(messages) == 1
+        assert messages[0]["role"] == "user"
+        assert messages[0]["content"] == [
+            {
+                "type": "text",
+                "text": "STRATEGY",
+                "cache_control": {"type": "ephemeral"},
+            },
+            {"type": "text", "text": "GAMESTATE"},
+            {"type": "text", "text": "MEMORY"},
+        ]
+
+    @pytest.mark.parametrize(
+        ("model", "expected"),
+        [
+            ("anthropic/claude-sonnet-4.5", list),
+            ("openai/gpt-5", str),
+        ],
+    )
+    def test_auto_format_chunks_anthropic_models(
+        self, model: str, expected: type
+    ) -> None:
+        """Auto format (the default) should send chunks only to Anthropic models."""
+        bot = make_bot(model=model)
+
+        messages = bot._build_messages("STRATEGY", "GAMESTATE", "MEMORY")
+
+        assert isinstance(messages[0]["content"], expected)
+
+
+# ============================================================================
+# Test _call_llm
+# ============================================================================
+
+
+class TestCallLLM:
+    """Tests for the turn deadline in Bot._call_llm."""
+
+    @pytest.mark.parametrize(
+        ("model_config", "sdk_max_retries", "expected"),
+        [
+            # 3 attempts of (3 SDK tries + 2 * 8s SDK backoff), 1s + 2s backoff
+            ({}, 2, (10.0 * 3 + 16) * 3 + 3),
+            ({"timeout": 5}, 2, (5 * 3 + 16) * 3 + 3),  # model config overrides
+            ({"timeout": "slow"}, 2, (10.0 * 3 + 16) * 3 + 3),  # non-numeric ignored
+            ({}, 0, 10.0 * 3 + 3),  # SDK retries disabled
+        ],
+    )
+    async def test_deadline_covers_retries_and_backoff(
+        self, model_config: dict[str, Any], sdk_max_retries: int, expected: float
+    ) -> None:
+        """Deadline should cover LLMClient and SDK retries plus their backoff."""
+        bot = make_bot()
+        bot.model_config = model_config
+        bot._llm = StallingLLM(  # type: ignore[assignment]
+            timeout=10.0, max_retries=3, sdk_max_retries=sdk_max_retries
+        )
+        deadlines: list[float] = []
+
+        async def fake_wait_for(coro: Any, timeout: float) -> str:
+            coro.close()
+            deadlines.append(timeout)
+            return "response"
+
+        with patch("balatrollm.bot.asyncio.wait_for", side_effect=fake_wait_for):
+            assert await bot._call_llm([], []) == "response"
+
+        assert deadlines == [expected]
+
+    async def test_expired_deadline_raises_timeout(self) -> None:
+        """A stalled call should be cancelled and raise LLMTimeoutError."""
+        bot = make_bot()
+        llm = StallingLLM(timeout=0.01, max_retries=1, sdk_max_retries=0)
+        bot._llm = llm  # type: ignore[assignment]
+
+        with pytest.raises(LLMTimeoutError, match="turn deadline"):
+            await bot._call_llm([], [])
+
+        assert llm.cancelled
+
+
+# ============================================================================
+# Test _get_llm_response
+# ============================================================================
+
+
+class TestGetLLMResponse:
+    """Tests for the concurrent screenshot in Bot._get_llm_response."""
+
+    async def test_cancel_cancels_screenshot(self) -> None:
+        """Cancelling the turn should cancel the in-flight screenshot."""
+        bot = make_bot()
+        bot.strategy = MagicMock()
+        bot.strategy.render_strategy.return_value = "STRATEGY"
+        bot.strategy.render_gamestate.return_value = "GAMESTATE"
+        bot.strategy.render_memory.return_value = "MEMORY"
+        llm = StallingLLM()
+        balatro = StallingBalatro()
+        bot._llm = llm  # type: ignore[assignment]
+        bot._balatro = balatro  # type: ignore[assignment]
+        bot._collector = MagicMock()
+        bot._collector.write_request.return_value = "request-00001"
+
+        turn = asyncio.create_task(bot._get_llm_response({"state": "SHOP"}))
+        await asyncio.wait_for(llm.started.wait(), timeout=1)
+        turn.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await turn
+
+        assert llm.cancelled
+        assert balatro.cancelled == ["screenshot"]
+        bot._collector.write_response.assert_not_called()
@@ -1,10 +1,12 @@
 """Unit tests for the cli module."""
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
-from balatrollm.cli import BALATROLLM_CONFIG_ENV, _resolve_config_path
+from balatrollm.cli import BALATROLLM_CONFIG_ENV, _loop_factory, _resolve_config_path
 
 # ============================================================================
 # Test _resolve_config_path
@@ -50,3 +52,45 @@ class TestResolveConfigPath:
         monkeypatch.setenv(BALATROLLM_CONFIG_ENV, "")
         result = _resolve_config_path(None)
         assert result is None
+
+
+# ============================================================================
+# Test _loop_factory
+# ============================================================================
+
+
+class TestLoopFactory:
+    """Tests for _loop_factory helper function."""
+
+    def test_none_when_uvloop_missing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Default event loop should be used when uvloop is not installed."""
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        assert _loop_factory() is None
+
+
+# ============================================================================
+# Test CLI import cost
+# ============================================================================
+
+
+class TestCliImport:
+    """Tests that the CLI entry point imports only what argument parsing needs."""
+
+    def test_cli_import_skips_runtime_dependencies(self) -> None:
+        """Importing balatrollm.cli should not load openai, httpx or jinja2."""
+        code = (
+            "import sys, balatrollm.cli; "
+            "print(sorted(m for m in ('openai', 'httpx', 'jinja2') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_package_exports_resolve(self) -> None:
+        """Lazily exported names should resolve to the real objects."""
+        import balatrollm
+        from balatrollm.bot import Bot
+
+        assert balatrollm.Bot is Bot
+        assert all(hasattr(balatrollm, name) for name in balatrollm.__all__)
@@ -1,14 +1,12 @@
 """Tests for the BalatroLLM client module."""
 
 import json
-from unittest.mock import AsyncMock
 
-import httpx
 import pytest
 import respx
 from httpx import Response
 
-from balatrollm.client import BalatroClient, BalatroError
+from balatrollm.client import BalatroClient, BalatroError, create_http_client
 
 # ============================================================================
 # TestBalatroError
@@ -48,6 +46,17 @@ class TestBalatroError:
         assert "[BAD_REQUEST]" in str(error)
         assert "Invalid parameters or protocol error" in str(error)
 
+    def test_error_without_data(self) -> None:
+        """Verify a missing data object keeps the message readable."""
+        error = BalatroError(code=-32000, message="Server-side failure")
+        assert error.data is None
+        assert str(error) == "[UNKNOWN] Server-side failure"
+
+    def test_error_data_without_name(self) -> None:
+        """Verify data without a name does not raise KeyError."""
+        error = BalatroError(code=-32000, message="Server-side failure", data={})
+        assert str(error) == "[UNKNOWN] Server-side failure"
+
 
 # ============================================================================
 # TestBalatroClient
@@ -80,17 +89,29 @@ class TestBalatroClient:
             async with client:
                 assert client._client is not None
 
-    async def test_context_manager_closes_client(self) -> None:
-        """Verify __aexit__ closes the client and sets _client to None."""
+    async def test_context_manager_closes_owned_client(self) -> None:
+        """Verify __aexit__ closes a client it created and sets _client to None."""
         client = BalatroClient()
-        mock_http_client = AsyncMock(spec=httpx.AsyncClient)
-        client._client = mock_http_client
-
-        await client.__aexit__(None, None, None)
+        async with client:
+            http_client = client._client
+        assert http_client is not None
 
-        mock_http_client.aclose.assert_called_once()
+        assert http_client.is_closed
         assert client._client is None
 
+    async def test_shared_http_client_is_not_closed(self) -> None:
+        """Verify a passed-in client is used by every instance and left open."""
+        async with create_http_client() as shared:
+            async with BalatroClient(http_client=shared) as first:
+                assert first._client is shared
+            async with BalatroClient(
+                port=12347, timeout=5.0, http_client=shared
+            ) as other:
+                assert other._client is shared
+                assert other._url == "http://127.0.0.1:12347/"
+            assert not shared.is_closed
+            assert other._client is None
+
     async def test_call_without_context_raises_error(self) -> None:
         """Verify calling without context manager raises RuntimeError."""
         client = BalatroClient()
@@ -111,16 +132,16 @@ class TestBalatroClientCall:
         self, respx_mock: respx.MockRouter
     ) -> None:
         """Each call increments the internal request ID."""
-        respx_mock.post("/").mock(
+        route = respx_mock.post("/").mock(
             return_value=Response(200, json={"jsonrpc": "2.0", "result": {}, "id": 1})
         )
 
         async with BalatroClient() as client:
-            assert client._request_id == 0
             await client.call("method1")
-            assert client._request_id == 1
             await client.call("method2")
-            assert client._request_id == 2
+
+        ids = [json.loads(call.request.content)["id"] for call in route.calls]
+        assert ids == [1, 2]
 
     async def test_call_formats_request_correctly(
         self, respx_mock: respx.MockRouter
@@ -144,6 +165,48 @@ class TestBalatroClientCall:
         assert json_payload["params"] == {}
         assert json_payload["id"] == 1
 
+    async def test_call_sends_json_content_type(
+        self, respx_mock: respx.MockRouter
+    ) -> None:
+        """Verify the pre-serialized body is sent as application/json."""
+        route = respx_mock.post("/").mock(
+            return_value=Response(200, json={"jsonrpc": "2.0", "result": {}, "id": 1})
+        )
+
+        async with BalatroClient() as client:
+            await client.call("gamestate")
+
+        request = route.calls.last.request
+        assert request.headers["content-type"] == "application/json"
+
+    async def test_call_uses_client_timeout(self, respx_mock: respx.MockRouter) -> None:
+        """Verify each request carries this client's timeout."""
+        route = respx_mock.post("/").mock(
+            return_value=Response(200, json={"jsonrpc": "2.0", "result": {}, "id": 1})
+        )
+
+        async with BalatroClient(timeout=5.0) as client:
+            await client.call("gamestate")
+
+        timeouts = route.calls.last.request.extensions["timeout"]
+        assert timeouts["read"] == 5.0
+
+    async def test_call_omits_unused_default_headers(
+        self, respx_mock: respx.MockRouter
+    ) -> None:
+        """Verify httpx's Accept/Accept-Encoding/User-Agent defaults are not sent."""
+        route = respx_mock.post("/").mock(
+            return_value=Response(200, json={"jsonrpc": "2.0", "result": {}, "id": 1})
+        )
+
+        async with BalatroClient() as client:
+            await client.call("gamestate")
+
+        headers = route.calls.last.request.headers
+        assert "accept" not in headers
+        assert "accept-encoding" not in headers
+        assert "user-agent" not in headers
+
     async def test_call_returns_result(self, respx_mock: respx.MockRouter) -> None:
         """Verify the result field is extracted and returned."""
         expected_result = {"state": "SELECTING_HAND", "hand": []}
@@ -282,3 +345,22 @@ class TestBalatroClientCall:
         assert error.code == -32000
         assert error.message == "Server-side failure"
         assert error.data == {"name": "INTERNAL_ERROR"}
+
+    async def test_call_raises_balatro_error_without_data(
+        self, respx_mock: respx.MockRouter
+    ) -> None:
+        """Verify an error response missing data still raises BalatroError."""
+        respx_mock.post("/").mock(
+            return_value=Response(
+                200,
+                json={
+                    "jsonrpc": "2.0",
+                    "error": {"code": -32000, "message": "Server-side failure"},
+                    "id": 1,
+                },
+            )
+        )
+
+        async with BalatroClient() as client:
+            with pytest.raises(BalatroError, match="Server-side failure"):
+                await client.call("save")
@@ -1,6 +1,9 @@
 """Unit tests for the collector module."""
 
 import json
+import os
+import statistics
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -14,13 +17,21 @@ from balatrollm.collector import (
     Collector,
     Stats,
     _generate_run_dir,
+    _manifest_json,
+    _read_last_line,
+    _RunningStat,
+    _write_atomic,
 )
 from balatrollm.config import Task
+from balatrollm.strategy import StrategyManifest
 
 # ============================================================================
 # Test _generate_run_dir
 # ============================================================================
 
+# 2024-01-01T12:00:00.042Z
+NOW_NS = 1_704_110_400_042_000_000
+
 
 class TestGenerateRunDir:
     """Tests for _generate_run_dir function."""
@@ -34,8 +45,7 @@ class TestGenerateRunDir:
             stake="WHITE",
             strategy="default",
         )
-        with patch("balatrollm.collector.datetime") as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = "20240101_120000_123"
+        with patch("balatrollm.collector.time.time_ns", return_value=NOW_NS):
             result = _generate_run_dir(task, tmp_path)
 
         # Check path structure: base/runs/v{version}/{strategy}/{vendor}/{model}/{timestamp}_{deck}_{stake}_{seed}
@@ -47,6 +57,21 @@ class TestGenerateRunDir:
         assert "WHITE" in str(result)
         assert "AAAAAAA" in str(result)
 
+    def test_dir_name_has_millisecond_timestamp(self, tmp_path: Path) -> None:
+        """Directory name should start with a local timestamp to the millisecond."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="AAAAAAA",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        with patch("balatrollm.collector.time.time_ns", return_value=NOW_NS):
+            result = _generate_run_dir(task, tmp_path)
+
+        seconds = time.strftime("%Y%m%d_%H%M%S", time.localtime(NOW_NS // 10**9))
+        assert result.name == f"{seconds}_042_RED_WHITE_AAAAAAA"
+
     def test_model_with_colon_in_name(self, tmp_path: Path) -> None:
         """Model names with colons should work (e.g., meta-llama/llama-3:70b)."""
         task = Task(
@@ -56,8 +81,7 @@ class TestGenerateRunDir:
             stake="RED",
             strategy="default",
         )
-        with patch("balatrollm.collector.datetime") as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = "20240101_120000_123"
+        with patch("balatrollm.collector.time.time_ns", return_value=NOW_NS):
             result = _generate_run_dir(task, tmp_path)
 
         assert "meta-llama" in str(result)
@@ -77,6 +101,75 @@ class TestGenerateRunDir:
         assert "invalid_model" in str(result)
 
 
+# ============================================================================
+# Test _read_last_line
+# ============================================================================
+
+
+class TestReadLastLine:
+    """Tests for reading the final JSONL record from the end of the file."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+    def test_returns_last_line(self, tmp_path: Path, chunk_size: int) -> None:
+        """Should return the last line regardless of chunk boundaries."""
+        path = tmp_path / "gamestates.jsonl"
+        path.write_bytes(b'{"a": 1}\n{"b": 22}\n{"c": 333}\n')
+        assert _read_last_line(path, chunk_size) == b'{"c": 333}'
+
+    def test_single_line_without_newline(self, tmp_path: Path) -> None:
+        """A lone unterminated line should be returned whole."""
+        path = tmp_path / "gamestates.jsonl"
+        path.write_bytes(b'{"only": true}')
+        assert _read_last_line(path, 4) == b'{"only": true}'
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """An empty file should yield no line."""
+        path = tmp_path / "gamestates.jsonl"
+        path.write_bytes(b"")
+        assert _read_last_line(path) == b""
+
+
+# ============================================================================
+# Test _write_atomic
+# ============================================================================
+
+
+class TestWriteAtomic:
+    """Tests for atomic file replacement."""
+
+    def test_replaces_contents_without_leftovers(self, tmp_path: Path) -> None:
+        """Should swap in the new contents and remove the temporary file."""
+        path = tmp_path / "latest.json"
+        path.write_bytes(b'{"old": true}')
+
+        _write_atomic(path, b'{"new": true}')
+
+        assert path.read_bytes() == b'{"new": true}'
+        assert [p.name for p in tmp_path.iterdir()] == ["latest.json"]
+
+    def test_keeps_umask_permissions(self, tmp_path: Path) -> None:
+        """Should create files with the same mode as a plain open() would."""
+        plain = tmp_path / "plain.json"
+        plain.write_bytes(b"{}")
+        path = tmp_path / "latest.json"
+
+        _write_atomic(path, b"{}")
+
+        assert path.stat().st_mode == plain.stat().st_mode
+
+    def test_failed_replace_removes_temp_file(self, tmp_path: Path) -> None:
+        """Should keep the old contents and clean up when the replace fails."""
+        path = tmp_path / "latest.json"
+        path.write_bytes(b'{"old": true}')
+
+        with patch("os.replace", side_effect=OSError("busy")):
+            with pytest.raises(OSError):
+                _write_atomic(path, b'{"new": true}')
+
+        assert path.read_bytes() == b'{"old": true}'
+        assert [p.name for p in tmp_path.iterdir()] == ["latest.json"]
+
+
 # ============================================================================
 # Test ChatCompletion Dataclasses
 # ============================================================================
@@ -242,6 +335,28 @@ class TestCollectorInit:
         assert "name" in data
         assert "version" in data
 
+    def test_manifest_loaded_once_per_strategy(self, tmp_path: Path) -> None:
+        """Should read a strategy manifest once and reuse it for later runs."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        _manifest_json.cache_clear()
+        with patch(
+            "balatrollm.collector.StrategyManifest.from_file",
+            wraps=StrategyManifest.from_file,
+        ) as from_file:
+            first = Collector(task, tmp_path)
+            second = Collector(task, tmp_path)
+
+        from_file.assert_called_once_with("default")
+        assert (first.run_dir / "strategy.json").read_bytes() == (
+            second.run_dir / "strategy.json"
+        ).read_bytes()
+
 
 # ============================================================================
 # Test Collector.record_call
@@ -311,6 +426,90 @@ class TestCollectorRecordCall:
             collector.record_call("invalid")  # type: ignore[arg-type]
 
 
+# ============================================================================
+# Test Collector.record_failure / reset_failures
+# ============================================================================
+
+
+class TestCollectorFailures:
+    """Tests for consecutive failure tracking."""
+
+    def test_record_failure_updates_latest_json(self, tmp_path: Path) -> None:
+        """Should increment counter and write it to latest.json."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+
+        collector.record_failure()
+
+        data = json.loads((tmp_path / "runs" / "latest.json").read_text())
+        assert data["consecutive_failures"] == 1
+
+    def test_reset_failures_updates_latest_json(self, tmp_path: Path) -> None:
+        """Should reset counter and write it to latest.json."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+        collector.record_failure()
+
+        collector.reset_failures()
+
+        data = json.loads((tmp_path / "runs" / "latest.json").read_text())
+        assert data["consecutive_failures"] == 0
+
+    def test_reset_failures_skips_write_when_unchanged(self, tmp_path: Path) -> None:
+        """Should not rewrite latest.json when there were no failures."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+
+        with patch.object(collector, "_write_latest_json") as mock_write:
+            collector.reset_failures()
+
+        mock_write.assert_not_called()
+
+    def test_latest_json_contents(self, tmp_path: Path) -> None:
+        """latest.json should hold the run paths, failure count and finish reason."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+        relative = collector.run_dir.relative_to(tmp_path / "runs")
+
+        collector.record_failure()
+        collector.set_finish_reason("lost")
+
+        data = json.loads((tmp_path / "runs" / "latest.json").read_text())
+        assert data == {
+            "task": str(relative / "task.json"),
+            "responses": str(relative / "responses.jsonl"),
+            "requests": str(relative / "requests.jsonl"),
+            "gamestates": str(relative / "gamestates.jsonl"),
+            "max_failures": Collector.MAX_CONSECUTIVE_FAILURES,
+            "consecutive_failures": 1,
+            "finish_reason": "lost",
+        }
+
+
 # ============================================================================
 # Test Collector.write_request
 # ============================================================================
@@ -335,6 +534,7 @@ class TestCollectorWriteRequest:
 
         assert custom_id == "request-00001"
 
+        collector.flush()
         requests_file = collector.run_dir / "requests.jsonl"
         assert requests_file.exists()
 
@@ -392,6 +592,7 @@ class TestCollectorWriteResponse:
         collector.write_response(
             id="67890", custom_id="request-00001", response=response
         )
+        collector.flush()
 
         responses_file = collector.run_dir / "responses.jsonl"
         assert responses_file.exists()
@@ -416,6 +617,7 @@ class TestCollectorWriteResponse:
 
         error = ChatCompletionError(code="rate_limit", message="Too many requests")
         collector.write_response(id="67890", custom_id="request-00001", error=error)
+        collector.flush()
 
         responses_file = collector.run_dir / "responses.jsonl"
         with responses_file.open() as f:
@@ -446,6 +648,7 @@ class TestCollectorWriteGamestate:
 
         gamestate = {"state": "SELECTING_HAND", "ante_num": 1, "round_num": 1}
         collector.write_gamestate(gamestate)
+        collector.flush()
 
         gamestates_file = collector.run_dir / "gamestates.jsonl"
         assert gamestates_file.exists()
@@ -456,6 +659,296 @@ class TestCollectorWriteGamestate:
         assert data == gamestate
 
 
+# ============================================================================
+# Test Collector._update_batch_json
+# ============================================================================
+
+
+class TestCollectorUpdateBatchJson:
+    """Tests for batch.json updates across runs."""
+
+    def test_reuses_own_write(self, tmp_path: Path) -> None:
+        """Should not re-read batch.json that this process wrote last."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+        collector._update_batch_json(2, 4, "lost")
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError):
+            collector._update_batch_json(3, 7, "lost")
+
+        batch = json.loads((tmp_path / "runs" / "batch.json").read_text())
+        assert batch["runs_completed"] == 2
+        assert (batch["best_ante"], batch["best_round"]) == (3, 7)
+
+    def test_failed_write_keeps_cache(self, tmp_path: Path) -> None:
+        """A run whose batch.json write failed should not be counted later."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+        collector._update_batch_json(2, 4, "lost")
+
+        with patch("balatrollm.collector._write_atomic", side_effect=OSError):
+            with pytest.raises(OSError):
+                collector._update_batch_json(8, 24, "lost")
+        collector._update_batch_json(3, 7, "lost")
+
+        batch = json.loads((tmp_path / "runs" / "batch.json").read_text())
+        assert batch["runs_completed"] == 2
+        assert (batch["best_ante"], batch["best_round"]) == (3, 7)
+
+    def test_reloads_external_change(self, tmp_path: Path) -> None:
+        """Should re-read batch.json when another process has rewritten it."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+        collector._update_batch_json(2, 4, "lost")
+
+        batch_path = tmp_path / "runs" / "batch.json"
+        batch = json.loads(batch_path.read_text())
+        batch.update(best_ante=8, best_round=24, runs_completed=10)
+        batch_path.write_text(json.dumps(batch))
+        mtime_ns = batch_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(batch_path, ns=(mtime_ns, mtime_ns))
+
+        collector._update_batch_json(3, 7, "lost")
+
+        batch = json.loads(batch_path.read_text())
+        assert batch["runs_completed"] == 11
+        assert (batch["best_ante"], batch["best_round"]) == (8, 24)
+
+    def test_reloads_change_with_same_mtime(self, tmp_path: Path) -> None:
+        """Should re-read batch.json when its size changed but its mtime did not."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+        collector._update_batch_json(2, 4, "lost")
+
+        batch_path = tmp_path / "runs" / "batch.json"
+        st = batch_path.stat()
+        batch = json.loads(batch_path.read_text())
+        batch["runs_completed"] = 10
+        batch_path.write_text(json.dumps(batch))
+        os.utime(batch_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        collector._update_batch_json(1, 1, "lost")
+
+        batch = json.loads(batch_path.read_text())
+        assert batch["runs_completed"] == 11
+
+
+# ============================================================================
+# Test Collector.close
+# ============================================================================
+
+
+class TestCollectorClose:
+    """Tests for the persistent JSONL file handles."""
+
+    def test_lines_visible_before_close(self, tmp_path: Path) -> None:
+        """Written records should be readable once flushed, before close()."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+
+        collector.write_gamestate({"state": "SHOP"})
+        collector.write_gamestate({"state": "BLIND_SELECT"})
+        collector.flush()
+
+        lines = (collector.run_dir / "gamestates.jsonl").read_text().splitlines()
+        assert [json.loads(line)["state"] for line in lines] == [
+            "SHOP",
+            "BLIND_SELECT",
+        ]
+        collector.close()
+
+    def test_close_releases_files(self, tmp_path: Path) -> None:
+        """close() should stop the writer, close every file and be idempotent."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+        collector.write_request({})
+        collector.write_gamestate({})
+        collector.flush()
+        files = list(collector._jsonl_files.values())
+        writer = collector._writer
+
+        collector.close()
+        collector.close()
+
+        assert len(files) == 2
+        assert all(f.closed for f in files)
+        assert collector._jsonl_files == {}
+        assert writer is not None and not writer.is_alive()
+
+
+# ============================================================================
+# Test Collector._calculate_stats
+# ============================================================================
+
+
+class TestCollectorCalculateStats:
+    """Tests for _calculate_stats over the run JSONL files."""
+
+    def test_stats_from_written_records(self, tmp_path: Path) -> None:
+        """Should aggregate successful responses and use the last gamestate."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+        collector.write_gamestate(
+            {"state": "SHOP", "won": False, "ante_num": 1, "round_num": 2}
+        )
+        collector.write_gamestate(
+            {"state": "GAME_OVER", "won": False, "ante_num": 2, "round_num": 5}
+        )
+        for request_id, response_id, prompt, completion, cost in [
+            ("1000", "1100", 10, 2, 0.5),
+            ("2000", "2300", 30, 4, 1.5),
+        ]:
+            body = {
+                "provider": "OpenAI",
+                "usage": {
+                    "prompt_tokens": prompt,
+                    "completion_tokens": completion,
+                    "cost": cost,
+                },
+            }
+            collector.write_response(
+                id=response_id,
+                custom_id="request-00001",
+                response=ChatCompletionResponse(
+                    request_id=request_id, status_code=200, body=body
+                ),
+            )
+        collector.write_response(
+            id="3000",
+            custom_id="request-00003",
+            error=ChatCompletionError(code="timeout", message="Timed out"),
+        )
+        collector.close()
+
+        stats = collector._calculate_stats("lost")
+
+        assert stats.run_completed is True
+        assert stats.final_ante == 2
+        assert stats.final_round == 5
+        assert stats.providers == {"OpenAI": 2}
+        assert stats.tokens_in_total == 40
+        assert stats.tokens_out_avg == 3
+        assert stats.time_total_ms == 400
+        assert stats.cost_total == 2.0
+        assert stats.tokens_in_std == pytest.approx(statistics.stdev([10, 30]))
+
+    def test_single_response_run(self, tmp_path: Path) -> None:
+        """A run with one response should still produce stats."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+        collector.write_gamestate(
+            {"state": "GAME_OVER", "won": False, "ante_num": 1, "round_num": 1}
+        )
+        collector.write_response(
+            id="1500",
+            custom_id="request-00001",
+            response=ChatCompletionResponse(
+                request_id="1000",
+                status_code=200,
+                body={"usage": {"prompt_tokens": 7, "completion_tokens": 3}},
+            ),
+        )
+
+        stats = collector._calculate_stats("lost")
+        collector.close()
+
+        assert stats.tokens_in_avg == 7
+        assert stats.tokens_in_std == 0.0
+        assert stats.time_total_ms == 500
+
+    def test_raises_without_recorded_data(self, tmp_path: Path) -> None:
+        """Should raise before reading files when nothing was recorded."""
+        task = Task(
+            model="openai/gpt-4",
+            seed="TEST",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        collector = Collector(task, tmp_path)
+        collector.write_gamestate({"state": "SELECTING_HAND"})
+
+        with pytest.raises(RuntimeError, match="no gamestates or responses"):
+            collector._calculate_stats("connection_abort")
+        collector.close()
+
+
+# ============================================================================
+# Test _RunningStat
+# ============================================================================
+
+
+class TestRunningStat:
+    """Tests for the single-pass running statistics helper."""
+
+    def test_matches_statistics_module(self) -> None:
+        """Total, mean and stdev should match the statistics module."""
+        values = [1200, 950, 3100, 40, 2875, 1999]
+        stat = _RunningStat()
+        for x in values:
+            stat.add(x)
+
+        assert stat.n == len(values)
+        assert stat.total == sum(values)
+        assert stat.mean == pytest.approx(statistics.mean(values))
+        assert stat.stdev == pytest.approx(statistics.stdev(values))
+
+    def test_stdev_zero_below_two_points(self) -> None:
+        """stdev should be 0.0 rather than raise for fewer than two values."""
+        stat = _RunningStat()
+        assert stat.stdev == 0.0
+        stat.add(1)
+        assert stat.stdev == 0.0
+
+
 # ============================================================================
 # Test Stats dataclass
 # ============================================================================
@@ -498,3 +991,6 @@ class TestStats:
         assert stats.calls_total == 15
         assert stats.tokens_in_total == 10000
         assert stats.cost_total == 0.50
+
+        with pytest.raises(AttributeError):
+            stats.final_ante = 9  # type: ignore[misc]
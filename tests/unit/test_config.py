@@ -74,6 +74,7 @@ class TestParseEnvValue:
             == "https://api.openai.com/v1"
         )
         assert _parse_env_value("api_key", "sk-test") == "sk-test"
+        assert _parse_env_value("message_format", "chunks") == "chunks"
 
 
 # ============================================================================
@@ -236,6 +237,19 @@ class TestConfigValidate:
         with pytest.raises(ValueError, match="stake"):
             config.validate()
 
+    def test_lowercase_deck_and_stake_pass(self) -> None:
+        """Deck and stake names should be accepted in any case."""
+        config = Config(model=["openai/gpt-4"], deck=["red"], stake=["Gold"])
+        config.validate()
+        assert config.deck == ["RED"]
+        assert config.stake == ["GOLD"]
+
+    def test_invalid_message_format_raises(self) -> None:
+        """Unknown message_format should raise ValueError."""
+        config = Config(model=["openai/gpt-4"], message_format="INVALID")
+        with pytest.raises(ValueError, match="message_format"):
+            config.validate()
+
     def test_valid_config_passes(self) -> None:
         """Valid config should pass validation."""
         config = Config(
@@ -243,6 +257,7 @@ class TestConfigValidate:
             deck=["RED", "BLUE"],
             stake=["WHITE", "RED"],
             strategy=["default"],
+            message_format="chunks",
         )
         # Should not raise
         config.validate()
@@ -313,6 +328,23 @@ class TestConfigGenerateTasks:
         assert tasks[0].deck == "RED"
         assert tasks[0].stake == "WHITE"
 
+    def test_order_seed_varies_fastest(self) -> None:
+        """Tasks should be ordered strategy → model → deck → stake → seed."""
+        config = Config(
+            model=["m1", "m2"],
+            seed=["s1", "s2"],
+            deck=["RED"],
+            stake=["WHITE"],
+            strategy=["default"],
+        )
+        tasks = config.generate_tasks()
+        assert [(t.model, t.seed) for t in tasks] == [
+            ("m1", "s1"),
+            ("m1", "s2"),
+            ("m2", "s1"),
+            ("m2", "s2"),
+        ]
+
 
 # ============================================================================
 # Test Config.total_runs
@@ -389,6 +421,11 @@ parallel: 4
         assert config.model == ["openai/gpt-4"]
         assert config.parallel == 4
 
+    def test_load_missing_yaml_raises(self, tmp_path: Path) -> None:
+        """A missing YAML file should raise FileNotFoundError with its path."""
+        with pytest.raises(FileNotFoundError, match="Config file not found"):
+            Config.load(yaml_path=tmp_path / "missing.yaml")
+
     def test_load_precedence(self, tmp_path: Path) -> None:
         """CLI args should override YAML values."""
         yaml_file = tmp_path / "config.yaml"
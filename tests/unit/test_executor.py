@@ -0,0 +1,246 @@
+"""Unit tests for the executor module."""
+
+import asyncio
+from collections import deque
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from balatrobot import BalatroInstance
+
+from balatrollm.config import Config, Task
+from balatrollm.executor import Executor
+
+
+def make_tasks(n: int) -> list[Task]:
+    """Create n distinct tasks."""
+    return [
+        Task(
+            model="openai/gpt-4",
+            seed=f"SEED{i}",
+            deck="RED",
+            stake="WHITE",
+            strategy="default",
+        )
+        for i in range(n)
+    ]
+
+
+def fake_instances(*ports: int) -> dict[int, BalatroInstance]:
+    """Stand-ins for started instances; workers only read their log_path."""
+    return {
+        port: cast(BalatroInstance, SimpleNamespace(log_path=f"port-{port}.log"))
+        for port in ports
+    }
+
+
+# ============================================================================
+# Test Executor._next_task
+# ============================================================================
+
+
+class TestExecutorNextTask:
+    """Tests for per-worker queues with work stealing."""
+
+    def test_pops_own_queue_in_order(self) -> None:
+        """Worker should consume its own queue front to back."""
+        tasks = make_tasks(3)
+        executor = Executor(
+            config=Config(model=["openai/gpt-4"], api_key="test-key"), tasks=tasks
+        )
+        executor._queues = {12346: deque(tasks)}
+
+        assert [executor._next_task(12346) for _ in range(3)] == tasks
+        assert executor._next_task(12346) is None
+
+    def test_steals_half_from_largest_peer(self) -> None:
+        """Idle worker should steal the tail half of the largest peer queue."""
+        tasks = make_tasks(5)
+        executor = Executor(
+            config=Config(model=["openai/gpt-4"], api_key="test-key"), tasks=tasks
+        )
+        executor._queues = {
+            12346: deque(),
+            12347: deque(tasks[:1]),
+            12348: deque(tasks[1:]),
+        }
+
+        assert executor._next_task(12346) == tasks[3]
+        assert list(executor._queues[12346]) == [tasks[4]]
+        assert list(executor._queues[12348]) == tasks[1:3]
+        assert list(executor._queues[12347]) == tasks[:1]
+
+    def test_returns_none_when_all_queues_empty(self) -> None:
+        """Worker should stop when there is nothing left to steal."""
+        executor = Executor(config=Config(model=["openai/gpt-4"]), tasks=[])
+        executor._queues = {12346: deque(), 12347: deque()}
+
+        assert executor._next_task(12346) is None
+
+
+# ============================================================================
+# Test Executor._execute_tasks
+# ============================================================================
+
+
+class TestExecutorExecuteTasks:
+    """Tests for the per-port worker pool."""
+
+    async def test_every_task_runs_exactly_once(self) -> None:
+        """All tasks should be played once, spread over every port."""
+        tasks = make_tasks(7)
+        executor = Executor(
+            config=Config(model=["openai/gpt-4"], api_key="test-key"), tasks=tasks
+        )
+        executor._instances = fake_instances(12346, 12347, 12348)
+        played: list[tuple[Task, int]] = []
+        yield_to_loop = asyncio.sleep  # captured before asyncio.sleep is patched
+
+        class FakeBot:
+            def __init__(self, task: Task, config: Config, port: int, **_: Any) -> None:
+                self.task = task
+                self.port = port
+
+            def reset(self, task: Task) -> None:
+                self.task = task
+
+            async def __aenter__(self) -> "FakeBot":
+                return self
+
+            async def __aexit__(self, *_: Any) -> None:
+                pass
+
+            async def play(self, runs_dir: Any) -> None:
+                await yield_to_loop(0)
+                played.append((self.task, self.port))
+
+        with (
+            patch("balatrollm.executor.Bot", FakeBot),
+            patch("balatrollm.executor.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            await executor._execute_tasks()
+
+        assert sorted(t.seed for t, _ in played) == sorted(t.seed for t in tasks)
+        assert {port for _, port in played} == {12346, 12347, 12348}
+
+    async def test_bots_share_one_http_client(self) -> None:
+        """Every bot should get the same HTTP client, closed after all runs."""
+        tasks = make_tasks(4)
+        executor = Executor(
+            config=Config(model=["openai/gpt-4"], api_key="test-key"), tasks=tasks
+        )
+        executor._instances = fake_instances(12346, 12347)
+        clients: list[Any] = []
+
+        class FakeBot:
+            def __init__(
+                self, task: Task, config: Config, port: int, **kwargs: Any
+            ) -> None:
+                clients.append(kwargs["http_client"])
+
+            def reset(self, task: Task) -> None:
+                pass
+
+            async def __aenter__(self) -> "FakeBot":
+                assert not clients[-1].is_closed
+                return self
+
+            async def __aexit__(self, *_: Any) -> None:
+                pass
+
+            async def play(self, runs_dir: Any) -> None:
+                await asyncio.sleep(0)
+
+        with patch("balatrollm.executor.Bot", FakeBot):
+            await executor._execute_tasks()
+
+        assert len(clients) == 2
+        assert clients[0] is clients[1]
+        assert clients[0].is_closed
+
+    async def test_failed_worker_does_not_stop_others(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A worker whose bot cannot start should fail its task, not the others."""
+        tasks = make_tasks(4)
+        executor = Executor(
+            config=Config(model=["openai/gpt-4"], api_key="test-key"), tasks=tasks
+        )
+        executor._instances = fake_instances(12346, 12347)
+        played: list[Task] = []
+        yield_to_loop = asyncio.sleep
+
+        class FakeBot:
+            def __init__(self, task: Task, config: Config, port: int, **_: Any) -> None:
+                self.task = task
+
+            def reset(self, task: Task) -> None:
+                self.task = task
+
+            async def __aenter__(self) -> "FakeBot":
+                await yield_to_loop(0)
+                if self.task.seed == "SEED1":
+                    raise ConnectionError("instance unreachable")
+                return self
+
+            async def __aexit__(self, *_: Any) -> None:
+                pass
+
+            async def play(self, runs_dir: Any) -> None:
+                await yield_to_loop(0)
+                played.append(self.task)
+
+        with (
+            patch("balatrollm.executor.Bot", FakeBot),
+            patch("balatrollm.executor.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            await executor._execute_tasks()
+
+        # SEED1 was popped by the failed worker; SEED3 was stolen from its queue
+        assert sorted(t.seed for t in played) == ["SEED0", "SEED2", "SEED3"]
+        # ...and still counts as a failed run, so the progress reaches the total
+        lines = capsys.readouterr().out.splitlines()
+        errors = [line for line in lines if "ERROR" in line]
+        assert len(errors) == 1
+        assert "SEED1" in errors[0]
+        assert {line.split("]")[0] for line in lines} == {
+            "[1/4",
+            "[2/4",
+            "[3/4",
+            "[4/4",
+        }
+
+    async def test_backoff_only_after_failed_runs(self) -> None:
+        """Successful runs should not sleep; failures should back off 1s, 2s, ..."""
+        tasks = make_tasks(5)
+        executor = Executor(
+            config=Config(model=["openai/gpt-4"], api_key="test-key"), tasks=tasks
+        )
+        executor._instances = fake_instances(12346)
+        failing = {"SEED1", "SEED2", "SEED3"}
+
+        class FakeBot:
+            def __init__(self, task: Task, config: Config, port: int, **_: Any) -> None:
+                self.task = task
+
+            def reset(self, task: Task) -> None:
+                self.task = task
+
+            async def __aenter__(self) -> "FakeBot":
+                return self
+
+            async def __aexit__(self, *_: Any) -> None:
+                pass
+
+            async def play(self, runs_dir: Any) -> None:
+                if self.task.seed in failing:
+                    raise RuntimeError("run failed")
+
+        with (
+            patch("balatrollm.executor.Bot", FakeBot),
+            patch("balatrollm.executor.asyncio.sleep", new_callable=AsyncMock) as sleep,
+        ):
+            await executor._execute_tasks()
+
+        assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0, 4.0]
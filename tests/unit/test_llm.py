@@ -43,6 +43,17 @@ class TestLLMClientInit:
         assert client.timeout == 60.0
         assert client.max_retries == 5
 
+    def test_sdk_max_retries(self) -> None:
+        """SDK retries should default to openai's and follow a shared client."""
+        client = LLMClient(base_url="https://api.test.com", api_key="test-key")
+        assert client.sdk_max_retries == openai.DEFAULT_MAX_RETRIES
+
+        shared = MagicMock(max_retries=0)
+        client = LLMClient(
+            base_url="https://api.test.com", api_key="test-key", openai_client=shared
+        )
+        assert client.sdk_max_retries == 0
+
 
 # ============================================================================
 # Test LLMClient Context Manager
@@ -70,7 +81,7 @@ class TestLLMClientContextManager:
                 )
 
     async def test_exit_closes_client(self) -> None:
-        """__aexit__ should close and clear the client."""
+        """__aexit__ should close and clear a client it created."""
         client = LLMClient(base_url="https://api.test.com", api_key="test-key")
 
         mock_async_client = AsyncMock()
@@ -81,6 +92,25 @@ class TestLLMClientContextManager:
         mock_async_client.close.assert_called_once()
         assert client._client is None
 
+    async def test_shared_client_is_used_and_not_closed(self) -> None:
+        """A passed-in OpenAI client should be used as-is and left open."""
+        shared = AsyncMock()
+        first = LLMClient(
+            base_url="https://api.test.com", api_key="test-key", openai_client=shared
+        )
+        second = LLMClient(
+            base_url="https://api.test.com", api_key="test-key", openai_client=shared
+        )
+
+        with patch("balatrollm.llm.openai.AsyncOpenAI") as mock_openai:
+            async with first, second:
+                assert first._client is shared
+                assert second._client is shared
+
+        mock_openai.assert_not_called()
+        shared.close.assert_not_called()
+        assert first._client is None
+
     async def test_consecutive_timeouts_reset_on_enter(self) -> None:
         """Consecutive timeout counter should reset on context entry."""
         client = LLMClient(base_url="https://api.test.com", api_key="test-key")
@@ -1,8 +1,10 @@
 """Unit tests for the StrategyManager module."""
 
+from pathlib import Path
+
 import pytest
 
-from balatrollm.strategy import StrategyManager
+from balatrollm.strategy import StrategyManager, StrategyManifest
 from tests.unit.conftest import load_unit_fixture, load_unit_golden
 
 
@@ -28,6 +30,25 @@ class TestStrategyManagerInit:
         assert "BLIND_SELECT" in sm._tools
 
 
+class TestStrategyManifest:
+    """Tests for StrategyManifest.from_file()."""
+
+    def test_loads_default_manifest(self) -> None:
+        """Verify the default strategy manifest loads."""
+        manifest = StrategyManifest.from_file("default")
+        assert manifest.name
+        assert isinstance(manifest.tags, list)
+
+    def test_missing_fields_raises(self, tmp_path: Path) -> None:
+        """Verify ValueError listing the missing manifest fields."""
+        (tmp_path / "broken").mkdir()
+        (tmp_path / "broken" / "manifest.json").write_text(
+            '{"name": "broken", "description": "", "version": "0.1.0"}'
+        )
+        with pytest.raises(ValueError, match=r"\['author', 'tags'\]"):
+            StrategyManifest.from_file("broken", strategies_dir=tmp_path)
+
+
 class TestStrategyManagerGetTools:
     """Tests for get_tools() method."""
 
@@ -111,6 +132,18 @@ class TestRenderStrategyGolden:
         assert result == expected
 
 
+class TestRenderStrategyStability:
+    """The strategy prompt prefix must not depend on turn-varying data."""
+
+    @pytest.mark.parametrize("strategy", ["default", "aggressive", "conservative"])
+    def test_strategy_is_byte_stable_across_gamestates(self, strategy: str) -> None:
+        """Verify different gamestates render the same strategy text."""
+        sm = StrategyManager(strategy)
+        first = sm.render_strategy({"state": "BLIND_SELECT", "money": 4})
+        second = sm.render_strategy({"state": "SHOP", "money": 25, "round_num": 3})
+        assert first == second
+
+
 class TestRenderMemoryGolden:
     """Golden tests for memory template."""
 